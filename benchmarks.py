@@ -0,0 +1,165 @@
+"""
+Бенчмарки гарячих шляхів усіх завдань (1-7).
+
+Кожен випадок вимірюється на зростаючих розмірах входу (10^3 ... 10^7),
+найкращий час з кількох повторів зберігається у JSON-базі. Під час
+порівняння з базою програма завершується з кодом 1, якщо хоча б один
+результат повільніший за базовий більш ніж на заданий поріг.
+
+Приклади:
+    python benchmarks.py --save-baseline
+    python benchmarks.py --max-size 1000000 --threshold 0.2
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+import generators
+import task1_linked_list
+import task2_pythagoras_tree
+import task4_heap_visualization
+import task5_tree_traversal
+import task6_greedy_dynamic
+import task7_monte_carlo
+
+
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+BASELINE_FILE = "benchmarks_baseline.json"
+
+
+# Кожен випадок: (підготовка входу за розміром, вимірювана функція, максимальний розмір)
+CASES = {
+    "linked_list_sort": (lambda n: generators.random_linked_list(n, seed=n),
+                         task1_linked_list.merge_sort_linked_list, 10**6),
+    "linked_list_merge": (lambda n: generators.random_sorted_linked_lists(n, seed=n),
+                          lambda lists: task1_linked_list.merge_two_sorted_lists(*lists), 10**6),
+    "linked_list_reverse": (lambda n: generators.random_linked_list(n, seed=n),
+                            task1_linked_list.reverse_linked_list, 10**6),
+    "dijkstra": (lambda n: generators.random_graph(n, seed=n),
+                 lambda graph: graph.dijkstra("v0"), 10**6),
+    "heap_build": (lambda n: generators.random_values(n, seed=n),
+                   task4_heap_visualization.create_min_heap, 10**7),
+    "tree_build": (lambda n: generators.random_values(n, seed=n), task5_tree_traversal.heap_to_tree, 10**7),
+    "dfs": (lambda n: generators.random_tree(n, seed=n), task5_tree_traversal.depth_first_search, 10**6),
+    "bfs": (lambda n: generators.random_tree(n, seed=n), task5_tree_traversal.breadth_first_search, 10**6),
+    "knapsack_greedy": (lambda n: (generators.random_menu(n, seed=n), 1000),
+                        lambda args: task6_greedy_dynamic.greedy_algorithm(*args), 10**6),
+    "knapsack_dp": (lambda n: (generators.random_menu(n, seed=n), 1000),
+                    lambda args: task6_greedy_dynamic.dynamic_programming(*args), 10**5),
+    "dice_simulation": (lambda n: n, lambda n: task7_monte_carlo.simulate_dice_rolls(n, seed=0), 10**7),
+    "tree_geometry": (lambda n: max(1, round(math.log2(n + 1))),
+                      task2_pythagoras_tree.pythagoras_tree_segments, 10**7),
+}
+
+
+def measure(setup, function, size, repeat):
+    """Найкращий час виконання function на входах з setup(size) за repeat повторів"""
+    best = math.inf
+    for _ in range(repeat):
+        # Вхід готується заново, бо частина функцій змінює його на місці
+        data = setup(size)
+        start = time.perf_counter()
+        function(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(cases=None, max_size=10**5, repeat=3):
+    """
+    Виконує бенчмарки.
+
+    Args:
+        cases: назви випадків (None - усі)
+        max_size: максимальний розмір входу
+        repeat: кількість повторів
+
+    Returns:
+        dict: {випадок: {розмір: найкращий час у секундах}}
+    """
+    results = {}
+    for name in cases or CASES:
+        setup, function, case_max = CASES[name]
+        results[name] = {}
+        for size in SIZES:
+            if size > min(max_size, case_max):
+                break
+            elapsed = measure(setup, function, size, repeat)
+            results[name][str(size)] = elapsed
+            print(f"{name:<22} {size:>10,} {elapsed * 1000:>12.3f} мс")
+    return results
+
+
+def compare_with_baseline(results, baseline, threshold):
+    """
+    Порівнює результати з базою.
+
+    Returns:
+        list: [(випадок, розмір, базовий час, поточний час)] для регресій
+    """
+    regressions = []
+    for name, timings in results.items():
+        for size, elapsed in timings.items():
+            reference = baseline.get(name, {}).get(size)
+            if reference is not None and elapsed > reference * (1 + threshold):
+                regressions.append((name, size, reference, elapsed))
+    return regressions
+
+
+def main(argv=None):
+    """Запуск бенчмарків з командного рядка"""
+    parser = argparse.ArgumentParser(description="Бенчмарки завдань 1-7")
+    parser.add_argument("cases", nargs="*",
+                        help=f"випадки для вимірювання (за замовчуванням - усі): {', '.join(CASES)}")
+    parser.add_argument("--max-size", type=int, default=10**5, help="максимальний розмір входу")
+    parser.add_argument("--repeat", type=int, default=3, help="кількість повторів")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="файл бази (JSON)")
+    parser.add_argument("--save-baseline", action="store_true", help="зберегти результати як базу")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="допустиме сповільнення відносно бази (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"невідомі випадки: {', '.join(unknown)}")
+
+    print(f"{'Випадок':<22} {'Розмір':>10} {'Час':>15}")
+    print("-" * 50)
+    results = run_benchmarks(args.cases, args.max_size, args.repeat)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        for name, timings in results.items():
+            baseline.setdefault(name, {}).update(timings)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nБазу збережено у файл: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nБаза {args.baseline} відсутня - порівняння пропущено")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    if not regressions:
+        print(f"\nРегресій відносно бази не виявлено (поріг {args.threshold:.0%})")
+        return 0
+
+    print(f"\nРегресії (поріг {args.threshold:.0%}):")
+    for name, size, reference, elapsed in regressions:
+        print(f"  {name} [{int(size):,}]: {reference * 1000:.3f} мс -> {elapsed * 1000:.3f} мс "
+              f"(+{elapsed / reference - 1:.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
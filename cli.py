@@ -0,0 +1,244 @@
+"""
+Єдина точка входу для запуску алгоритмів завдань 1-7 на згенерованих входах.
+
+Кожна підкоманда будує відтворюваний вхід заданого розміру (див. generators),
+виконує алгоритм --repeat разів і виводить час кожного запуску.
+З --json результат виводиться одним JSON-об'єктом для подальшої обробки.
+
+Приклади:
+    python cli.py dijkstra --size 1000000
+    python cli.py knapsack --algorithm dp --size 50000 --budget 10000 --repeat 3
+    python cli.py traversal --order bfs --size 100000 --json --instrument
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+
+import generators
+import instrumentation
+import task1_linked_list
+import task2_pythagoras_tree
+import task4_heap_visualization
+import task5_tree_traversal
+import task6_greedy_dynamic
+import task7_monte_carlo
+
+
+def _linked_list_setup(args):
+    if args.operation == "merge":
+        return generators.random_sorted_linked_lists(args.size, seed=args.seed)
+    return generators.random_linked_list(args.size, seed=args.seed)
+
+
+def _linked_list_run(args, data):
+    if args.operation == "sort":
+        result = task1_linked_list.merge_sort_linked_list(data)
+    elif args.operation == "reverse":
+        result = task1_linked_list.reverse_linked_list(data)
+    else:
+        result = task1_linked_list.merge_two_sorted_lists(*data)
+    return {"head": result.head.data if result.head else None}
+
+
+def _pythagoras_setup(args):
+    # Дерево рівня L має 2^L - 1 гілок, тому рівень підбирається за розміром
+    return max(1, round(math.log2(args.size + 1)))
+
+
+def _pythagoras_run(args, level):
+    segments = task2_pythagoras_tree.pythagoras_tree_segments(level, args.angle)
+    return {"level": level, "segments": len(segments)}
+
+
+def _dijkstra_setup(args):
+    return generators.random_graph(args.size, args.edges_per_vertex, seed=args.seed)
+
+
+def _dijkstra_run(args, graph):
+    distances = graph.dijkstra("v0")
+    reachable = [distance for distance, _ in distances.values() if distance != float("inf")]
+    return {"vertices": len(distances), "reachable": len(reachable), "max_distance": max(reachable)}
+
+
+def _heap_setup(args):
+    return generators.random_values(args.size, seed=args.seed)
+
+
+def _heap_run(args, values):
+    if args.kind == "min":
+        heap = task4_heap_visualization.create_min_heap(values)
+    else:
+        heap = task4_heap_visualization.create_max_heap(values)
+    return {"root": heap[0] if heap else None}
+
+
+def _traversal_setup(args):
+    return generators.random_tree(args.size, seed=args.seed)
+
+
+def _traversal_run(args, root):
+    if args.order == "dfs":
+        visited = task5_tree_traversal.depth_first_search(root)
+    else:
+        visited = task5_tree_traversal.breadth_first_search(root)
+    return {"visited": len(visited)}
+
+
+def _knapsack_setup(args):
+    return generators.random_menu(args.size, seed=args.seed)
+
+
+def _knapsack_run(args, items):
+    if args.algorithm == "greedy":
+        selected, cost, calories = task6_greedy_dynamic.greedy_algorithm(items, args.budget)
+    elif args.algorithm == "dp":
+        selected, cost, calories = task6_greedy_dynamic.dynamic_programming(items, args.budget)
+    else:
+        selected, cost, calories, _ = task6_greedy_dynamic.branch_and_bound(items, args.budget)
+    return {"items": len(selected), "cost": cost, "calories": calories}
+
+
+def _monte_carlo_setup(args):
+    return args.size
+
+
+def _monte_carlo_run(args, num_simulations):
+    if args.workers == 1:
+        probabilities, _ = task7_monte_carlo.simulate_dice_rolls(num_simulations, seed=args.seed)
+    else:
+        probabilities, _ = task7_monte_carlo.simulate_dice_rolls_parallel(
+            num_simulations, seed=args.seed, workers=args.workers)
+    analytical = task7_monte_carlo.analytical_probabilities()
+    error = max(abs(probabilities[s] - analytical[s]) for s in analytical)
+    return {"max_abs_error": error}
+
+
+# Підкоманда: (опис, підготовка входу, запуск алгоритму, розмір за замовчуванням)
+COMMANDS = {
+    "linked-list": ("Завдання 1: сортування, обернення та злиття однозв'язних списків",
+                    _linked_list_setup, _linked_list_run, 10**5),
+    "pythagoras": ("Завдання 2: геометрія дерева Піфагора (розмір - кількість гілок)",
+                   _pythagoras_setup, _pythagoras_run, 10**5),
+    "dijkstra": ("Завдання 3: алгоритм Дейкстри на випадковому графі (розмір - кількість вершин)",
+                 _dijkstra_setup, _dijkstra_run, 10**5),
+    "heap": ("Завдання 4: побудова бінарної купи", _heap_setup, _heap_run, 10**6),
+    "traversal": ("Завдання 5: обхід бінарного дерева в глибину або ширину",
+                  _traversal_setup, _traversal_run, 10**5),
+    "knapsack": ("Завдання 6: вибір їжі (розмір - кількість страв)",
+                 _knapsack_setup, _knapsack_run, 10**3),
+    "monte-carlo": ("Завдання 7: симуляція кидків кубиків (розмір - кількість кидків)",
+                    _monte_carlo_setup, _monte_carlo_run, 10**6),
+}
+
+
+def parse_args(argv=None):
+    """Аргументи командного рядка"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--size", type=int, help="розмір згенерованого входу")
+    common.add_argument("--seed", type=int, default=0, help="зерно генератора входу")
+    common.add_argument("--repeat", type=int, default=1, help="кількість запусків")
+    common.add_argument("--json", action="store_true", help="вивести результат у форматі JSON")
+    common.add_argument("--instrument", action="store_true",
+                        help="зібрати таймінги та лічильники (див. instrumentation)")
+
+    parser = argparse.ArgumentParser(description="Запуск алгоритмів завдань 1-7 на згенерованих входах")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    commands = {name: subparsers.add_parser(name, parents=[common], help=description)
+                for name, (description, _, _, _) in COMMANDS.items()}
+
+    commands["linked-list"].add_argument("--operation", choices=("sort", "reverse", "merge"),
+                                         default="sort", help="операція над списком")
+    commands["pythagoras"].add_argument("--angle", type=float, default=45, help="кут нахилу гілок")
+    commands["dijkstra"].add_argument("--edges-per-vertex", type=int, default=4,
+                                      help="середня кількість ребер на вершину")
+    commands["heap"].add_argument("--kind", choices=("min", "max"), default="min", help="тип купи")
+    commands["traversal"].add_argument("--order", choices=("dfs", "bfs"), default="dfs",
+                                       help="порядок обходу")
+    commands["knapsack"].add_argument("--algorithm", choices=("greedy", "dp", "bnb"), default="dp",
+                                      help="алгоритм: жадібний, динамічне програмування, гілки та межі")
+    commands["knapsack"].add_argument("--budget", type=int, default=1000, help="бюджет")
+    commands["monte-carlo"].add_argument("--workers", type=int, default=1,
+                                         help="кількість процесів (0 - за кількістю ядер)")
+
+    args = parser.parse_args(argv)
+    if args.size is None:
+        args.size = COMMANDS[args.command][3]
+    if args.size < 1 or args.repeat < 1:
+        parser.error("--size та --repeat мають бути додатними")
+    if args.command == "monte-carlo" and args.workers == 0:
+        args.workers = None
+    return args
+
+
+def run(args):
+    """
+    Виконує підкоманду.
+
+    Вхід будується заново перед кожним запуском, бо частина алгоритмів
+    змінює його на місці; час побудови входу вимірюється окремо.
+
+    Returns:
+        dict: Параметри запуску, час кожного запуску та підсумок результату
+    """
+    _, setup, function, _ = COMMANDS[args.command]
+    if args.instrument:
+        instrumentation.reset()
+        instrumentation.enable()
+
+    setup_times, run_times = [], []
+    summary = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        data = setup(args)
+        setup_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        summary = function(args, data)
+        run_times.append(time.perf_counter() - start)
+
+    report = {
+        "command": args.command,
+        "size": args.size,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "setup_seconds": setup_times,
+        "run_seconds": run_times,
+        "best_seconds": min(run_times),
+        "mean_seconds": statistics.mean(run_times),
+        "result": summary,
+    }
+    if args.instrument:
+        instrumentation.disable()
+        report["instrumentation"] = instrumentation.get_stats()
+    return report
+
+
+def print_report(report):
+    """Виводить результат запуску у зручному для читання вигляді"""
+    print(f"{report['command']}: розмір {report['size']:,}, seed {report['seed']}")
+    for i, (setup_time, run_time) in enumerate(zip(report["setup_seconds"], report["run_seconds"]), 1):
+        print(f"  запуск {i}: {run_time * 1000:.3f} мс (підготовка входу {setup_time * 1000:.3f} мс)")
+    print(f"  найкращий: {report['best_seconds'] * 1000:.3f} мс, "
+          f"середній: {report['mean_seconds'] * 1000:.3f} мс")
+    print(f"  результат: {report['result']}")
+    for name, value in report.get("instrumentation", {}).get("counters", {}).items():
+        print(f"  {name}: {value:,}")
+
+
+def main(argv=None):
+    """Запуск з командного рядка"""
+    args = parse_args(argv)
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Відтворювані генератори синтетичних входів для завдань 1-7.
+
+Усі генератори приймають seed, тому однаковий виклик завжди дає
+однаковий вхід - це дозволяє порівнювати час між запусками.
+"""
+
+import heapq
+import random
+
+import task1_linked_list
+import task3_dijkstra
+import task5_tree_traversal
+import task6_greedy_dynamic
+
+
+def random_values(n, seed=0):
+    """Список з n випадкових чисел у [0, 1)"""
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(n)]
+
+
+def make_linked_list(values):
+    """Будує однозв'язний список зі значень (за O(n), без insert_at_end)"""
+    linked_list = task1_linked_list.LinkedList()
+    for value in reversed(values):
+        linked_list.insert_at_beginning(value)
+    return linked_list
+
+
+def random_linked_list(n, seed=0):
+    """Однозв'язний список з n випадкових чисел"""
+    return make_linked_list(random_values(n, seed))
+
+
+def random_sorted_linked_lists(n, seed=0):
+    """Два відсортовані списки із сумарною кількістю елементів n"""
+    values = random_values(n, seed)
+    return make_linked_list(sorted(values[:n // 2])), make_linked_list(sorted(values[n // 2:]))
+
+
+def random_graph(num_vertices, edges_per_vertex=4, max_weight=100, seed=0):
+    """
+    Випадковий зв'язний граф: ланцюжок вершин v0...v(n-1) плюс випадкові ребра.
+
+    Args:
+        num_vertices: Кількість вершин
+        edges_per_vertex: Середня кількість ребер на вершину
+        max_weight: Максимальна вага ребра
+        seed: Зерно генератора
+
+    Returns:
+        Graph: Граф з вершинами "v0", "v1", ...
+    """
+    rng = random.Random(seed)
+    graph = task3_dijkstra.Graph()
+    names = [f"v{i}" for i in range(num_vertices)]
+    for i in range(1, num_vertices):
+        graph.add_edge(names[i - 1], names[i], rng.randint(1, max_weight))
+    for _ in range(num_vertices * (edges_per_vertex - 1)):
+        graph.add_edge(rng.choice(names), rng.choice(names), rng.randint(1, max_weight))
+    return graph
+
+
+def random_menu(n, max_cost=100, max_calories=1000, seed=0):
+    """Меню з n випадкових страв (див. task6_greedy_dynamic.generate_random_items)"""
+    return task6_greedy_dynamic.generate_random_items(n, max_cost, max_calories, seed=seed)
+
+
+def random_tree(n, seed=0):
+    """Повне бінарне дерево з n вузлів, побудоване з випадкової мін-купи"""
+    heap = random_values(n, seed)
+    heapq.heapify(heap)
+    return task5_tree_traversal.heap_to_tree(heap)
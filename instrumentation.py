@@ -0,0 +1,151 @@
+"""
+Опціональне профілювання та лічильники гарячих шляхів алгоритмів.
+
+За замовчуванням вимкнено: декоратор timed лише перевіряє прапорець ENABLED,
+а алгоритми записують лічильники один раз наприкінці виклику і лише тоді,
+коли інструментування увімкнено.
+
+Приклад:
+    import instrumentation
+    instrumentation.enable(profile=True)
+    graph.dijkstra("A")
+    print(instrumentation.get_stats())
+    instrumentation.write_prometheus("metrics.prom")
+    instrumentation.write_profile("dijkstra.prof")  # для pstats / snakeviz
+"""
+
+import cProfile
+import functools
+import time
+
+
+ENABLED = False
+
+_timings = {}
+_counters = {}
+_profiler = None
+
+
+def enable(profile=False):
+    """
+    Вмикає збір статистики.
+
+    Args:
+        profile: також запустити cProfile для всього коду до виклику disable()
+                 (після disable() профілювання продовжується у тому ж профілі)
+    """
+    global ENABLED, _profiler
+    ENABLED = True
+    if profile:
+        if _profiler is None:
+            _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def disable():
+    """Вимикає збір статистики (зібрані дані зберігаються)"""
+    global ENABLED
+    ENABLED = False
+    if _profiler is not None:
+        _profiler.disable()
+
+
+def reset():
+    """Очищає зібрані таймінги, лічильники та профіль"""
+    global _profiler
+    _timings.clear()
+    _counters.clear()
+    if _profiler is not None:
+        _profiler.disable()
+        _profiler = None
+
+
+def count(name, value=1):
+    """Збільшує лічильник name на value"""
+    _counters[name] = _counters.get(name, 0) + value
+
+
+def timed(name):
+    """
+    Декоратор: записує кількість викликів, сумарний і максимальний час функції.
+
+    Коли інструментування вимкнено, функція викликається напряму.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                calls, total, longest = _timings.get(name, (0, 0.0, 0.0))
+                _timings[name] = (calls + 1, total + elapsed, max(longest, elapsed))
+        return wrapper
+    return decorator
+
+
+def get_stats():
+    """
+    Повертає зібрану статистику.
+
+    Returns:
+        dict: {"timings": {назва: {"calls", "total_seconds", "max_seconds"}},
+               "counters": {назва: значення}}
+    """
+    return {
+        "timings": {name: {"calls": calls, "total_seconds": total, "max_seconds": longest}
+                    for name, (calls, total, longest) in _timings.items()},
+        "counters": dict(_counters),
+    }
+
+
+def _metric_name(name):
+    """Перетворює назву на допустиму назву метрики Prometheus"""
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+
+def write_prometheus(path):
+    """Записує статистику у текстовому форматі Prometheus (для node_exporter textfile)"""
+    lines = [
+        "# HELP algorithm_calls_total Number of instrumented calls.",
+        "# TYPE algorithm_calls_total counter",
+    ]
+    for name, (calls, _, _) in sorted(_timings.items()):
+        lines.append(f'algorithm_calls_total{{function="{name}"}} {calls}')
+
+    lines += [
+        "# HELP algorithm_seconds_total Total time spent in instrumented calls.",
+        "# TYPE algorithm_seconds_total counter",
+    ]
+    for name, (_, total, _) in sorted(_timings.items()):
+        lines.append(f'algorithm_seconds_total{{function="{name}"}} {total:.9f}')
+
+    lines += [
+        "# HELP algorithm_seconds_max Longest instrumented call.",
+        "# TYPE algorithm_seconds_max gauge",
+    ]
+    for name, (_, _, longest) in sorted(_timings.items()):
+        lines.append(f'algorithm_seconds_max{{function="{name}"}} {longest:.9f}')
+
+    for name, value in sorted(_counters.items()):
+        metric = f"algorithm_{_metric_name(name)}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def write_profile(path):
+    """
+    Записує профіль cProfile (формат pstats) у файл.
+
+    Потребує enable(profile=True); після запису профілювання зупиняється.
+    """
+    if _profiler is None:
+        raise RuntimeError("Профілювання не увімкнено: викличте enable(profile=True)")
+    _profiler.dump_stats(path)
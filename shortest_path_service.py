@@ -0,0 +1,202 @@
+"""
+Асинхронний сервіс запитів найкоротших шляхів поверх Graph із завдання 3.
+
+Запити, що надходять протягом короткого вікна, групуються за початковою
+вершиною: для кожної групи алгоритм Дейкстри виконується один раз у пулі
+потоків або процесів, а всі очікувачі отримують відповідь зі спільного
+результату. Цикл подій при цьому не блокується.
+
+Приклад:
+    service = ShortestPathService(graph, window=0.005)
+    path, distance = await service.get_shortest_path("A", "F")
+    await service.close()
+
+Генератор навантаження:
+    python shortest_path_service.py --vertices 5000 --requests 500 --sources 20
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import generators
+from task3_dijkstra import Graph, reconstruct_path
+
+
+# Граф у процесі-виконавці (завантажується ініціалізатором пулу процесів)
+_worker_graph = None
+
+
+def _load_worker_graph(path):
+    """Ініціалізатор процесу: відображає файл графа у пам'ять один раз"""
+    global _worker_graph
+    _worker_graph = Graph.load(path)
+
+
+def _worker_dijkstra(start_vertex):
+    return _worker_graph.dijkstra(start_vertex)
+
+
+class ShortestPathService:
+    """
+    Фасад для асинхронних запитів найкоротших шляхів з групуванням за джерелом.
+
+    Перший запит для нової початкової вершини відкриває вікно тривалістю
+    window секунд, після якого dijkstra передається виконавцю. Група лишається
+    відкритою, доки результат не готовий: запити з тієї ж вершини, що надійшли
+    за цей час (у тому числі поки виконавець зайнятий), обслуговуються одним
+    викликом dijkstra.
+    """
+
+    def __init__(self, graph=None, window=0.005, executor=None, dijkstra=None):
+        """
+        Args:
+            graph: Граф (для виконання у пулі потоків)
+            window: Тривалість вікна групування запитів у секундах
+            executor: Пул для виконання dijkstra (за замовчуванням - один потік)
+            dijkstra: Функція start_vertex -> результат dijkstra
+                      (за замовчуванням - graph.dijkstra)
+        """
+        if graph is None and dijkstra is None:
+            raise ValueError("Потрібно вказати graph або dijkstra")
+        self.window = window
+        self._dijkstra = dijkstra or graph.dijkstra
+        self._executor = executor or ThreadPoolExecutor(max_workers=1)
+        # Початкова вершина -> список (кінцева вершина, future очікувача) відкритої групи
+        self._pending = {}
+        self.batches = 0
+        self.requests = 0
+
+    @classmethod
+    def from_file(cls, path, window=0.005, workers=None):
+        """
+        Сервіс з пулом процесів, кожен з яких відображає граф з файлу у пам'ять.
+
+        Args:
+            path: Файл, збережений Graph.save
+            window: Тривалість вікна групування запитів у секундах
+            workers: Кількість процесів (None - за кількістю ядер)
+
+        Returns:
+            ShortestPathService: Сервіс
+        """
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_load_worker_graph,
+                                       initargs=(path,))
+        return cls(window=window, executor=executor, dijkstra=_worker_dijkstra)
+
+    async def get_shortest_path(self, start_vertex, end_vertex):
+        """
+        Знаходить найкоротший шлях між двома вершинами
+
+        Returns:
+            Кортеж (шлях, відстань), як у Graph.get_shortest_path
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.requests += 1
+
+        batch = self._pending.get(start_vertex)
+        if batch is None:
+            batch = self._pending[start_vertex] = []
+            loop.call_later(self.window, self._flush, start_vertex)
+        batch.append((end_vertex, future))
+        return await future
+
+    def _flush(self, start_vertex):
+        """Запускає dijkstra для групи запитів з однієї початкової вершини"""
+        self.batches += 1
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._executor, self._dijkstra, start_vertex)
+        task.add_done_callback(lambda done: self._resolve(done, start_vertex))
+
+    def _resolve(self, done, start_vertex):
+        """Закриває групу і відповідає всім її очікувачам зі спільного результату"""
+        batch = self._pending.pop(start_vertex)
+        error = done.exception()
+        result = None if error is not None else done.result()
+        for end_vertex, future in batch:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+                continue
+            try:
+                future.set_result(reconstruct_path(result, start_vertex, end_vertex))
+            except KeyError as missing:
+                future.set_exception(missing)
+
+    async def close(self):
+        """Зупиняє пул виконавців"""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+
+async def run_load(query, queries, concurrency):
+    """
+    Генератор навантаження: виконує запити з обмеженою кількістю одночасних.
+
+    Args:
+        query: Корутина (start_vertex, end_vertex) -> (шлях, відстань)
+        queries: Список пар (початкова вершина, кінцева вершина)
+        concurrency: Максимальна кількість одночасних запитів
+
+    Returns:
+        tuple: (результати у порядку запитів, запитів за секунду)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(start_vertex, end_vertex):
+        async with semaphore:
+            return await query(start_vertex, end_vertex)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(limited(s, e) for s, e in queries))
+    return results, len(queries) / (time.perf_counter() - start)
+
+
+async def _compare(graph, queries, concurrency, window):
+    """Порівнює виконання кожного запиту окремо з групуванням за джерелом"""
+    executor = ThreadPoolExecutor(max_workers=1)
+    loop = asyncio.get_running_loop()
+
+    async def unbatched(start_vertex, end_vertex):
+        return await loop.run_in_executor(executor, graph.get_shortest_path, start_vertex, end_vertex)
+
+    plain_results, plain_rate = await run_load(unbatched, queries, concurrency)
+    executor.shutdown()
+
+    service = ShortestPathService(graph, window=window)
+    batched_results, batched_rate = await run_load(service.get_shortest_path, queries, concurrency)
+    await service.close()
+
+    same = all(a[1] == b[1] for a, b in zip(plain_results, batched_results))
+    print(f"Без групування: {plain_rate:10.1f} запитів/с ({len(queries)} викликів dijkstra)")
+    print(f"З групуванням:  {batched_rate:10.1f} запитів/с ({service.batches} викликів dijkstra)")
+    print(f"Прискорення: {batched_rate / plain_rate:.1f}x, відстані збігаються: {'так' if same else 'ні'}")
+
+
+def main(argv=None):
+    """Генератор навантаження для порівняння пропускної здатності"""
+    parser = argparse.ArgumentParser(description="Навантажувальний тест сервісу найкоротших шляхів")
+    parser.add_argument("--vertices", type=int, default=5000, help="кількість вершин графа")
+    parser.add_argument("--requests", type=int, default=500, help="кількість запитів")
+    parser.add_argument("--sources", type=int, default=20, help="кількість різних початкових вершин")
+    parser.add_argument("--concurrency", type=int, default=200, help="кількість одночасних запитів")
+    parser.add_argument("--window", type=float, default=0.005, help="вікно групування у секундах")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора")
+    args = parser.parse_args(argv)
+
+    graph = generators.random_graph(args.vertices, seed=args.seed)
+    rng = random.Random(args.seed)
+    names = list(graph.vertices)
+    sources = rng.sample(names, min(args.sources, len(names)))
+    queries = [(rng.choice(sources), rng.choice(names)) for _ in range(args.requests)]
+
+    print(f"Граф: {args.vertices:,} вершин, запитів: {args.requests:,}, "
+          f"початкових вершин: {len(sources)}, одночасно: {args.concurrency}")
+    asyncio.run(_compare(graph, queries, args.concurrency, args.window))
+
+
+if __name__ == "__main__":
+    main()
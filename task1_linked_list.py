@@ -7,6 +7,8 @@
 3. Об'єднання двох відсортованих списків
 """
 
+import instrumentation
+
 
 class Node:
     """Вузол однозв'язного списку"""
@@ -61,6 +63,7 @@ class LinkedList:
         return result
 
 
+@instrumentation.timed("reverse_linked_list")
 def reverse_linked_list(linked_list):
     """
     Реверсування однозв'язного списку шляхом зміни посилань між вузлами.
@@ -87,6 +90,7 @@ def reverse_linked_list(linked_list):
     return linked_list
 
 
+@instrumentation.timed("merge_sort_linked_list")
 def merge_sort_linked_list(linked_list):
     """
     Сортування однозв'язного списку алгоритмом злиття (merge sort).
@@ -146,23 +150,34 @@ def _merge_sorted_lists(left, right):
     """
     Допоміжна функція для злиття двох відсортованих списків.
     Використовується в merge sort.
+    Злиття виконується ітеративно (з фіктивним вузлом), тому глибина
+    стеку не залежить від довжини списків.
     """
-    if left is None:
-        return right
-    if right is None:
-        return left
-    
-    # Вибираємо менший елемент як початок результуючого списку
-    if left.data <= right.data:
-        result = left
-        result.next = _merge_sorted_lists(left.next, right)
-    else:
-        result = right
-        result.next = _merge_sorted_lists(left, right.next)
-    
-    return result
+    dummy = Node(None)
+    tail = dummy
+    comparisons = 0
+    
+    # Щоразу приєднуємо менший елемент (за рівності - з лівого списку)
+    while left is not None and right is not None:
+        comparisons += 1
+        if left.data <= right.data:
+            tail.next = left
+            left = left.next
+        else:
+            tail.next = right
+            right = right.next
+        tail = tail.next
+    
+    # Приєднуємо залишок одного зі списків
+    tail.next = left if left is not None else right
+    
+    if instrumentation.ENABLED:
+        instrumentation.count("merge_sorted_lists.comparisons", comparisons)
+    
+    return dummy.next
 
 
+@instrumentation.timed("merge_two_sorted_lists")
 def merge_two_sorted_lists(list1, list2):
     """
     Об'єднання двох відсортованих однозв'язних списків в один відсортований список.
@@ -1,8 +1,14 @@
 import os
 os.environ['TK_SILENCE_DEPRECATION'] = '1'
 
-import turtle
+import argparse
 import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Кількість гілок в одному елементі <path> потокового SVG
+SVG_SEGMENTS_PER_PATH = 10_000
 
 
 def draw_pythagoras_tree(t, branch_length, level, angle=45):
@@ -50,23 +56,489 @@ def draw_pythagoras_tree(t, branch_length, level, angle=45):
     t.backward(branch_length)
 
 
-def main():
+def pythagoras_tree_segments(level, angle=45, branch_length=100, start=(0, -300), heading=90,
+                             min_length=0.0, viewport=None):
     """
-    Основна функція для налаштування та запуску візуалізації дерева Піфагора.
+    Обчислює всі гілки дерева Піфагора без turtle та без рекурсії.
+
+    Гілки генеруються рівень за рівнем векторизовано (NumPy): кінці гілок
+    попереднього рівня стають початками двох нових гілок з напрямками
+    heading ± angle та довжиною, помноженою на cos(angle) - так само,
+    як у draw_pythagoras_tree.
+
+    Рівень деталізації: гілки, коротші за min_length, не генеруються
+    (усі гілки рівня мають однакову довжину, тож поділ просто зупиняється).
+    Для кутів понад 90° cos(angle) < 0 і довжина стає від'ємною (гілка
+    малюється назад, як turtle.forward з від'ємним кроком), тому всі
+    порівняння ведуться за модулем довжини.
+    Відсікання за областю перегляду: усе піддерево гілки лежить у колі
+    з центром у її початку та радіусом |length| / (1 - |cos(angle)|), тому
+    піддерева, чиє коло не перетинає viewport, відкидаються цілком.
+
+    Параметри:
+    level - рівень рекурсії (глибина)
+    angle - кут нахилу гілок у градусах
+    branch_length - довжина стовбура
+    start - координати початку стовбура
+    heading - напрямок стовбура у градусах (90 - вгору)
+    min_length - мінімальна довжина гілки, яка ще генерується
+    viewport - область перегляду (x_min, y_min, x_max, y_max) або None
+
+    Повертає:
+    масив NumPy форми (N, 2, 2): [[x0, y0], [x1, y1]] для кожної гілки
+    (без відсікання N = 2^level - 1)
+
+    >>> len(pythagoras_tree_segments(6)), len(pythagoras_tree_segments(6, angle=120))
+    (63, 63)
+    >>> len(pythagoras_tree_segments(6, angle=120, viewport=(-1000, -1000, 1000, 1000)))
+    63
+    """
+    blocks = list(iter_tree_segments(level, angle, branch_length, start, heading,
+                                     min_length, viewport))
+    if not blocks:
+        return np.empty((0, 2, 2))
+    return np.concatenate(blocks)
+
+
+def iter_tree_segments(level, angle=45, branch_length=100, start=(0, -300), heading=90,
+                       min_length=0.0, viewport=None, max_segments=None):
+    """
+    Генерує гілки дерева Піфагора блоками (див. pythagoras_tree_segments).
+
+    Без max_segments кожен блок - один рівень дерева. З max_segments
+    батьківські гілки рівня діляться на групи по max_segments // 2,
+    і піддерева груп обходяться в глибину, тому жоден блок не перевищує
+    max_segments гілок, а відкладені групи займають O(level * max_segments)
+    пам'яті незалежно від загальної кількості гілок.
+
+    Параметри:
+    level, angle, branch_length, start, heading, min_length, viewport -
+        як у pythagoras_tree_segments
+    max_segments - максимальна кількість гілок у блоці (None - без обмеження)
+
+    Повертає:
+    генератор масивів NumPy форми (n, 2, 2)
+    """
+    if level <= 0:
+        return
+
+    turn = math.radians(angle)
+    scale = math.cos(turn)
+    group = None if max_segments is None else max(1, max_segments // 2)
+
+    # Стек відкладених груп: (глибина, довжина гілок, кінці батьківських гілок,
+    # їхні напрямки, зміщення першої ще не обробленої батьківської гілки)
+    stack = [(0, branch_length, np.array([start], dtype=float),
+              np.array([math.radians(heading)]), 0)]
+
+    while stack:
+        depth, length, parent_ends, parent_headings, offset = stack.pop()
+        size = len(parent_ends) if group is None else group
+        if offset + size < len(parent_ends):
+            stack.append((depth, length, parent_ends, parent_headings, offset + size))
+
+        ends = parent_ends[offset:offset + size]
+        headings = parent_headings[offset:offset + size]
+        if depth == 0:
+            starts = ends
+        else:
+            # Кожна гілка породжує ліву (heading + angle) та праву (heading - angle)
+            starts = np.repeat(ends, 2, axis=0)
+            headings = np.column_stack((headings + turn, headings - turn)).ravel()
+
+        if abs(length) < min_length:
+            continue
+
+        if viewport is not None:
+            # Відстань від початку гілки до прямокутника області перегляду
+            radius = (abs(length) / (1 - abs(scale)) if abs(scale) < 1
+                      else abs(length) * (level - depth))
+            x_min, y_min, x_max, y_max = viewport
+            dx = np.maximum(np.maximum(x_min - starts[:, 0], starts[:, 0] - x_max), 0)
+            dy = np.maximum(np.maximum(y_min - starts[:, 1], starts[:, 1] - y_max), 0)
+            visible = dx * dx + dy * dy <= radius * radius
+            starts = starts[visible]
+            headings = headings[visible]
+            if len(starts) == 0:
+                continue
+
+        ends = starts + length * np.column_stack((np.cos(headings), np.sin(headings)))
+        yield np.stack((starts, ends), axis=1)
+
+        if depth + 1 < level:
+            stack.append((depth + 1, length * scale, ends, headings, 0))
+
+
+def tree_bounds(level, angle=45, branch_length=100, start=(0, -300), heading=90,
+                exact_levels=12):
+    """
+    Обмежувальний прямокутник дерева (x_min, y_min, x_max, y_max) без генерації всіх гілок.
+
+    Перші exact_levels рівнів обчислюються точно, а глибші піддерева
+    враховуються радіусом їхнього обмежувального кола.
+    """
+    levels = min(level, exact_levels)
+    segments = pythagoras_tree_segments(levels, angle, branch_length, start, heading)
+    if len(segments) == 0:
+        return (start[0], start[1], start[0], start[1])
+
+    points = segments.reshape(-1, 2)
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+
+    if level > levels:
+        scale = math.cos(math.radians(angle))
+        length = branch_length * scale ** levels
+        extra = (abs(length) / (1 - abs(scale)) if abs(scale) < 1
+                 else abs(length) * (level - levels))
+        low -= extra
+        high += extra
+
+    return (low[0], low[1], high[0], high[1])
+
+
+def draw_segments(t, screen, segments, flush_every=1000):
+    """
+    Швидке малювання готових гілок у turtle.
+
+    Автоматичне оновлення полотна вимикається (screen.tracer(0)), а екран
+    оновлюється через screen.update() кожні flush_every гілок. Turtle не
+    повертається назад по дереву, а переходить одразу до початку наступної
+    гілки з масиву pythagoras_tree_segments.
+
+    Параметри:
+    t - об'єкт turtle
+    screen - екран turtle
+    segments - масив гілок форми (N, 2, 2) у координатах turtle
+    flush_every - кількість гілок між оновленнями екрана
+    """
+    previous_tracer = screen.tracer()
+    screen.tracer(0, 0)
+
+    position = None
+    for index, (x0, y0, x1, y1) in enumerate(segments.reshape(-1, 4).tolist(), 1):
+        if position != (x0, y0):
+            t.penup()
+            t.goto(x0, y0)
+            t.pendown()
+        t.goto(x1, y1)
+        position = (x1, y1)
+
+        if index % flush_every == 0:
+            screen.update()
+
+    screen.update()
+    screen.tracer(previous_tracer)
+
+
+def _canvas_transform(bounds, width, height, margin=20):
+    """
+    Центр і масштаб, за якими область bounds (x_min, y_min, x_max, y_max)
+    вписується в полотно зі збереженням пропорцій та відступом margin.
     """
-    # Отримуємо рівень рекурсії від користувача
+    x_min, y_min, x_max, y_max = bounds
+    extent_x = max(x_max - x_min, 1e-9)
+    extent_y = max(y_max - y_min, 1e-9)
+    scale = min((width - 2 * margin) / extent_x, (height - 2 * margin) / extent_y)
+    center = np.array([(x_min + x_max) / 2, (y_min + y_max) / 2])
+    return center, scale
+
+
+def _fit_to_canvas(segments, width, height, margin=20, bounds=None):
+    """
+    Перетворює координати гілок у піксельні координати полотна.
+
+    Область bounds (за замовчуванням - межі самих гілок) масштабується
+    зі збереженням пропорцій так, щоб уміститися в полотно з відступом
+    margin; вісь y спрямована вниз.
+
+    Повертає:
+    масив форми (N, 2, 2) у пікселях
+    """
+    if len(segments) == 0:
+        return segments.copy()
+
+    if bounds is None:
+        points = segments.reshape(-1, 2)
+        bounds = (*points.min(axis=0), *points.max(axis=0))
+    center, scale = _canvas_transform(bounds, width, height, margin)
+
+    # Центруємо область на полотні
+    pixels = (segments - center) * scale
+    pixels[..., 0] += width / 2
+    pixels[..., 1] = height / 2 - pixels[..., 1]
+    return pixels
+
+
+def render_png(segments, filename, width=1000, height=800, color="green", line_width=1.0,
+               bounds=None):
+    """
+    Рендерить гілки у PNG без Tk (matplotlib Agg + LineCollection).
+
+    Параметри:
+    segments - масив гілок форми (N, 2, 2)
+    filename - шлях до PNG-файлу
+    width, height - розмір зображення в пікселях
+    color - колір гілок
+    line_width - товщина лінії в пікселях
+    bounds - область (x_min, y_min, x_max, y_max), що вписується в зображення
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+
+    dpi = 100
+    figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    FigureCanvasAgg(figure)
+    axes = figure.add_axes([0, 0, 1, 1])
+    axes.set_xlim(0, width)
+    axes.set_ylim(height, 0)
+    axes.axis("off")
+
+    pixels = _fit_to_canvas(segments, width, height, bounds=bounds)
+    axes.add_collection(LineCollection(pixels, colors=color,
+                                       linewidths=line_width * 72 / dpi))
+    figure.savefig(filename, dpi=dpi, facecolor="white")
+
+
+def render_svg(segments, filename, width=1000, height=800, color="green", line_width=1.0,
+               bounds=None):
+    """
+    Потоково записує гілки у SVG без Tk.
+
+    Гілки записуються пакетами по SVG_SEGMENTS_PER_PATH в окремі елементи
+    <path>, тому великий рядок з усім деревом у пам'яті не будується.
+
+    Параметри:
+    segments - масив гілок форми (N, 2, 2)
+    filename - шлях до SVG-файлу
+    width, height - розмір зображення в пікселях
+    color - колір гілок
+    line_width - товщина лінії в пікселях
+    bounds - область (x_min, y_min, x_max, y_max), що вписується в зображення
+    """
+    pixels = _fit_to_canvas(segments, width, height, bounds=bounds)
+
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+                f'height="{height}" viewBox="0 0 {width} {height}">\n')
+        f.write(f'<rect width="100%" height="100%" fill="white"/>\n')
+        f.write(f'<g fill="none" stroke="{color}" stroke-width="{line_width}" '
+                f'stroke-linecap="round">\n')
+
+        for offset in range(0, len(pixels), SVG_SEGMENTS_PER_PATH):
+            chunk = pixels[offset:offset + SVG_SEGMENTS_PER_PATH].reshape(-1, 4)
+            commands = " ".join(f"M{x0:.1f} {y0:.1f}L{x1:.1f} {y1:.1f}"
+                                for x0, y0, x1, y1 in chunk.tolist())
+            f.write(f'<path d="{commands}"/>\n')
+
+        f.write("</g>\n</svg>\n")
+
+
+def render_tree(level, filename, angle=45, width=1000, height=800, min_pixels=0.5,
+                viewport=None):
+    """
+    Рендерить дерево Піфагора у файл без дисплея (формат за розширенням: .png або .svg).
+
+    Гілки, коротші за min_pixels пікселів, не генеруються, а з viewport
+    (x_min, y_min, x_max, y_max у координатах дерева) рендериться лише
+    видима частина - так можна наближати дуже глибокі дерева.
+    """
+    bounds = viewport if viewport is not None else tree_bounds(level, angle)
+    _, scale = _canvas_transform(bounds, width, height)
+
+    segments = pythagoras_tree_segments(level, angle, min_length=min_pixels / scale,
+                                        viewport=viewport)
+    if filename.lower().endswith(".svg"):
+        render_svg(segments, filename, width, height, bounds=bounds)
+    else:
+        render_png(segments, filename, width, height, bounds=bounds)
+    return len(segments)
+
+
+def _rasterize_segments(tile, pixels, x0, y0, ink=0):
+    """
+    Растеризує гілки у фрагмент зображення (NumPy, без зовнішніх бібліотек).
+
+    Кожна гілка дискретизується точками з кроком не більше пів пікселя,
+    точки поза фрагментом відкидаються.
+
+    Параметри:
+    tile - масив uint8 форми (висота, ширина), змінюється на місці
+    pixels - гілки у піксельних координатах усього зображення, форма (N, 2, 2)
+    x0, y0 - координати лівого верхнього кута фрагмента
+    ink - значення пікселя лінії
+    """
+    if len(pixels) == 0:
+        return
+
+    starts = pixels[:, 0]
+    deltas = pixels[:, 1] - starts
+    steps = np.ceil(np.hypot(deltas[:, 0], deltas[:, 1]) * 2).astype(np.int64) + 1
+
+    # Параметр t від 0 до 1 для кожної точки кожної гілки
+    owner = np.repeat(np.arange(len(pixels)), steps)
+    first = np.cumsum(steps) - steps
+    t = (np.arange(len(owner)) - first[owner]) / np.maximum(steps[owner] - 1, 1)
+
+    xs = np.floor(starts[owner, 0] + deltas[owner, 0] * t).astype(np.int64) - x0
+    ys = np.floor(starts[owner, 1] + deltas[owner, 1] * t).astype(np.int64) - y0
+    inside = (xs >= 0) & (xs < tile.shape[1]) & (ys >= 0) & (ys < tile.shape[0])
+    tile[ys[inside], xs[inside]] = ink
+
+
+def _render_tile(filename, offset, width, height, tile, level, angle, bounds, min_pixels,
+                 max_segments):
+    """
+    Рендерить один фрагмент постера в окремому процесі.
+
+    Процес сам генерує лише ті гілки, що перетинають фрагмент
+    (відсікання за областю перегляду), блоками не більше max_segments
+    гілок, растеризує кожен блок одразу і пише результат прямо
+    у файл зображення, відображений у пам'ять.
+    """
+    x0, y0, x1, y1 = tile
+    center, scale = _canvas_transform(bounds, width, height)
+
+    # Область фрагмента у координатах дерева (з запасом в один піксель)
+    viewport = ((x0 - 1 - width / 2) / scale + center[0],
+                center[1] - (y1 + 1 - height / 2) / scale,
+                (x1 + 1 - width / 2) / scale + center[0],
+                center[1] - (y0 - 1 - height / 2) / scale)
+    image = np.memmap(filename, dtype=np.uint8, mode="r+", offset=offset,
+                      shape=(height, width))
+    region = np.array(image[y0:y1, x0:x1])
+
+    # Гілки генеруються й растеризуються блоками, щоб пам'ять процесу
+    # не залежала від кількості гілок у фрагменті
+    count = 0
+    for segments in iter_tree_segments(level, angle, min_length=min_pixels / scale,
+                                       viewport=viewport, max_segments=max_segments):
+        pixels = _fit_to_canvas(segments, width, height, bounds=bounds)
+        _rasterize_segments(region, pixels, x0, y0)
+        count += len(segments)
+
+    image[y0:y1, x0:x1] = region
+    image.flush()
+    return count
+
+
+def render_poster(level, filename, angle=45, width=20000, height=20000, tile_size=2048,
+                  workers=None, min_pixels=0.5, max_segments=100_000):
+    """
+    Багатопроцесний рендеринг дерева Піфагора великої роздільності у PGM.
+
+    Полотно ділиться на фрагменти tile_size×tile_size, які рендеряться
+    у пулі процесів. Файл зображення (бінарний PGM, відтінки сірого)
+    відображається в пам'ять, і кожен процес пише лише свій фрагмент.
+    Гілки фрагмента генеруються й растеризуються блоками не більше
+    max_segments (iter_tree_segments), тому пікова пам'ять процесу залежить
+    від розміру фрагмента, max_segments і глибини дерева (відкладені групи
+    гілок - O(level * max_segments)), але не від кількості гілок у фрагменті
+    чи розміру постера.
+
+    Повертає:
+    загальну кількість растеризованих гілок (гілки на межах фрагментів
+    враховуються кілька разів)
+    """
+    header = f"P5\n{width} {height}\n255\n".encode("ascii")
+    with open(filename, "wb") as f:
+        f.write(header)
+        f.truncate(len(header) + width * height)
+
+    image = np.memmap(filename, dtype=np.uint8, mode="r+", offset=len(header),
+                      shape=(height, width))
+    image[:] = 255
+    image.flush()
+    del image
+
+    bounds = tree_bounds(level, angle)
+    tiles = [(x, y, min(x + tile_size, width), min(y + tile_size, height))
+             for y in range(0, height, tile_size) for x in range(0, width, tile_size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_render_tile, filename, len(header), width, height, tile,
+                                   level, angle, bounds, min_pixels, max_segments)
+                   for tile in tiles]
+        return sum(future.result() for future in futures)
+
+
+def _parse_size(value):
+    """Розбирає розмір зображення у форматі ШИРИНАxВИСОТА"""
     try:
-        level = int(input("Введіть рівень рекурсії (рекомендовано 5-12): "))
-        if level < 0:
-            print("Рівень рекурсії повинен бути невід'ємним числом!")
-            return
+        width, height = (int(part) for part in value.lower().split("x"))
     except ValueError:
-        print("Будь ласка, введіть ціле число!")
+        raise argparse.ArgumentTypeError(f"Розмір має бути у форматі 1000x800: {value}")
+    return width, height
+
+
+def parse_args(argv=None):
+    """Аргументи командного рядка"""
+    parser = argparse.ArgumentParser(description="Дерево Піфагора")
+    parser.add_argument("--level", type=int, help="рівень рекурсії (рекомендовано 5-12)")
+    parser.add_argument("--angle", type=float, default=45, help="кут нахилу гілок у градусах")
+    parser.add_argument("--size", type=_parse_size, default=(1000, 800),
+                        help="розмір зображення/вікна, наприклад 1000x800")
+    parser.add_argument("--output",
+                        help="файл .png або .svg для рендерингу без дисплея "
+                             "(.pgm - багатопроцесний рендеринг постера фрагментами)")
+    parser.add_argument("--min-pixels", type=float, default=0.5,
+                        help="мінімальна довжина гілки в пікселях (рівень деталізації)")
+    parser.add_argument("--viewport", type=float, nargs=4,
+                        metavar=("X_MIN", "Y_MIN", "X_MAX", "Y_MAX"),
+                        help="видима область у координатах дерева (для наближення)")
+    parser.add_argument("--tile-size", type=int, default=2048,
+                        help="розмір фрагмента для рендерингу постера (.pgm)")
+    parser.add_argument("--workers", type=int, help="кількість процесів для рендерингу постера")
+    parser.add_argument("--classic", action="store_true",
+                        help="малювати рекурсивно з оновленням екрана після кожної гілки")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Основна функція для налаштування та запуску візуалізації дерева Піфагора.
+
+    З параметром --output дерево рендериться у файл без дисплея,
+    інакше - малюється у вікні turtle (з --classic - рекурсивно, як раніше).
+    """
+    args = parse_args(argv)
+    level = args.level
+    
+    if level is None and args.output is None:
+        # Отримуємо рівень рекурсії від користувача
+        try:
+            level = int(input("Введіть рівень рекурсії (рекомендовано 5-12): "))
+        except ValueError:
+            print("Будь ласка, введіть ціле число!")
+            return
+    elif level is None:
+        print("Для рендерингу у файл вкажіть --level!")
         return
     
+    if level < 0:
+        print("Рівень рекурсії повинен бути невід'ємним числом!")
+        return
+    
+    width, height = args.size
+    
+    if args.output and args.output.lower().endswith(".pgm"):
+        count = render_poster(level, args.output, args.angle, width, height,
+                              args.tile_size, args.workers, args.min_pixels)
+        print(f"Постер дерева Піфагора рівня {level} ({count:,} гілок) збережено у файл: {args.output}")
+        return
+    
+    if args.output:
+        count = render_tree(level, args.output, args.angle, width, height,
+                            args.min_pixels, args.viewport)
+        print(f"Дерево Піфагора рівня {level} ({count:,} гілок) збережено у файл: {args.output}")
+        return
+    
+    import turtle
+    
     # Налаштування вікна
     screen = turtle.Screen()
-    screen.setup(width=1000, height=800)
+    screen.setup(width=width, height=height)
     screen.bgcolor("white")
     screen.title(f"Дерево Піфагора - Рівень рекурсії: {level}")
     
@@ -84,7 +556,12 @@ def main():
     
     # Малюємо дерево Піфагора
     initial_length = 100
-    draw_pythagoras_tree(t, initial_length, level)
+    if args.classic:
+        draw_pythagoras_tree(t, initial_length, level, args.angle)
+    else:
+        segments = pythagoras_tree_segments(level, args.angle, initial_length,
+                                            start=(0, -300), heading=90)
+        draw_segments(t, screen, segments)
     
     # Ховаємо курсор
     t.hideturtle()
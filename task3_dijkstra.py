@@ -3,9 +3,108 @@
 Використовується бінарна купа (heapq) для оптимізації
 """
 
+import bisect
 import heapq
+import mmap as mmap_module
+import os
+import struct
+import tempfile
+from collections.abc import Mapping
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+import instrumentation
+
+
+# Заголовок бінарного файлу графа: сигнатура, кількість вершин, кількість записів
+# суміжності, тип індексів вершин, тип ваг (до 8 байт вирівнює заповнення)
+GRAPH_FILE_MAGIC = b"GRAPHCSR"
+_GRAPH_HEADER = struct.Struct("<8sQQ2s2s4x")
+
+
+def _aligned(offset):
+    """Округлює зміщення вгору до кратного 8 байтам"""
+    return (offset + 7) & ~7
+
+
+class _NameTable:
+    """
+    Таблиця імен вершин бінарного файлу графа.
+    
+    Імена зберігаються відсортованими, тому індекс за ім'ям знаходиться
+    бінарним пошуком без словника в пам'яті. Після першого повного обходу
+    (наприклад, в алгоритмі Дейкстри) імена декодуються один раз і кешуються.
+    """
+    
+    def __init__(self, buffer, offsets, start):
+        self._buffer = buffer
+        self._offsets = offsets
+        self._start = start
+        self._names = None
+        self._index = None
+    
+    def __len__(self):
+        return len(self._offsets) - 1
+    
+    def __getitem__(self, index):
+        if self._names is not None:
+            return self._names[index]
+        begin = self._start + int(self._offsets[index])
+        end = self._start + int(self._offsets[index + 1])
+        return bytes(self._buffer[begin:end]).decode("utf-8")
+    
+    def __iter__(self):
+        if self._names is None:
+            blob = bytes(self._buffer[self._start:self._start + int(self._offsets[-1])])
+            bounds = self._offsets.tolist()
+            self._names = [blob[begin:end].decode("utf-8") for begin, end in zip(bounds, bounds[1:])]
+            self._index = {name: i for i, name in enumerate(self._names)}
+        return iter(self._names)
+    
+    def index(self, name):
+        """Індекс вершини за ім'ям або -1, якщо її немає"""
+        if self._index is not None:
+            return self._index.get(name, -1)
+        position = bisect.bisect_left(self, name)
+        if position < len(self) and self[position] == name:
+            return position
+        return -1
+
+
+class _CSRAdjacency(Mapping):
+    """
+    Списки суміжності поверх масивів CSR (лише для читання).
+    
+    Поводиться як словник {вершина: [(сусід, вага), ...]}, але список
+    сусідів будується з масивів лише під час звернення до вершини.
+    """
+    
+    def __init__(self, names, offsets, targets, weights):
+        self._names = names
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+    
+    def __getitem__(self, vertex):
+        index = self._names.index(vertex) if isinstance(vertex, str) else -1
+        if index < 0:
+            raise KeyError(vertex)
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        names = self._names
+        return [(names[target], weight)
+                for target, weight in zip(self._targets[start:end].tolist(),
+                                          self._weights[start:end].tolist())]
+    
+    def __contains__(self, vertex):
+        return isinstance(vertex, str) and self._names.index(vertex) >= 0
+    
+    def __iter__(self):
+        return iter(self._names)
+    
+    def __len__(self):
+        return len(self._names)
+
 
 class Graph:
     """Клас для представлення зваженого графа"""
@@ -15,6 +114,9 @@ class Graph:
     
     def add_vertex(self, vertex: str):
         """Додає вершину до графа"""
+        if not isinstance(self.vertices, dict):
+            # Граф, завантажений з файлу, перед першою зміною переводиться у списки
+            self.vertices = dict(self.vertices.items())
         if vertex not in self.vertices:
             self.vertices[vertex] = []
     
@@ -35,6 +137,93 @@ class Graph:
         self.vertices[from_vertex].append((to_vertex, weight))
         self.vertices[to_vertex].append((from_vertex, weight))
     
+    def save(self, path: str):
+        """
+        Зберігає граф у компактному бінарному форматі CSR
+        
+        Формат (little-endian, кожен масив вирівняний до 8 байт):
+            заголовок: сигнатура, кількість вершин n, кількість записів суміжності m,
+                       тип індексів ("i4"/"i8"), тип ваг ("i4"/"i8"/"f8");
+            offsets[n + 1]: початок списку сусідів кожної вершини;
+            targets[m], weights[m]: індекси сусідів і ваги ребер;
+            name_offsets[n + 1] і байти UTF-8: відсортовані імена вершин.
+        
+        Args:
+            path: Шлях до файлу
+        """
+        names = sorted(self.vertices)
+        index_of = {name: i for i, name in enumerate(names)}
+        adjacency = [self.vertices[name] for name in names]
+        
+        offsets = np.zeros(len(names) + 1, dtype="<i8")
+        np.cumsum([len(neighbors) for neighbors in adjacency], out=offsets[1:])
+        num_entries = int(offsets[-1])
+        
+        index_type = "i4" if len(names) < 2**31 else "i8"
+        targets = np.fromiter((index_of[neighbor] for neighbors in adjacency for neighbor, _ in neighbors),
+                              dtype="<" + index_type, count=num_entries)
+        weights = [weight for neighbors in adjacency for _, weight in neighbors]
+        if not all(isinstance(weight, int) for weight in weights):
+            weight_type = "f8"
+        elif all(-2**31 <= weight < 2**31 for weight in weights):
+            weight_type = "i4"
+        else:
+            weight_type = "i8"
+        weights = np.array(weights, dtype="<" + weight_type)
+        
+        encoded = [name.encode("utf-8") for name in names]
+        name_offsets = np.zeros(len(names) + 1, dtype="<i8")
+        np.cumsum([len(name) for name in encoded], out=name_offsets[1:])
+        
+        with open(path, "wb") as f:
+            f.write(_GRAPH_HEADER.pack(GRAPH_FILE_MAGIC, len(names), num_entries,
+                                       index_type.encode(), weight_type.encode()))
+            for array in (offsets, targets, weights, name_offsets):
+                f.write(array.tobytes())
+                f.write(bytes(_aligned(f.tell()) - f.tell()))
+            f.write(b"".join(encoded))
+    
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "Graph":
+        """
+        Завантажує граф, збережений методом save
+        
+        З mmap=True файл відображається у пам'ять: ребра не читаються під час
+        завантаження, а сторінки файлу спільні для всіх процесів через кеш ОС.
+        Список сусідів вершини будується під час звернення до неї; перша зміна
+        графа (add_vertex, add_edge) переводить його у звичайні списки.
+        
+        Args:
+            path: Шлях до файлу
+            mmap: Відобразити файл у пам'ять замість читання повністю
+        
+        Returns:
+            Graph: Завантажений граф
+        """
+        with open(path, "rb") as f:
+            if mmap:
+                buffer = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)
+            else:
+                buffer = f.read()
+        
+        magic, num_vertices, num_entries, index_type, weight_type = _GRAPH_HEADER.unpack_from(buffer)
+        if magic != GRAPH_FILE_MAGIC:
+            raise ValueError(f"Файл {path} не є бінарним файлом графа")
+        
+        arrays = []
+        position = _GRAPH_HEADER.size
+        for dtype, count in (("<i8", num_vertices + 1), ("<" + index_type.decode(), num_entries),
+                             ("<" + weight_type.decode(), num_entries), ("<i8", num_vertices + 1)):
+            arrays.append(np.frombuffer(buffer, dtype=dtype, count=count, offset=position))
+            position = _aligned(position + arrays[-1].nbytes)
+        offsets, targets, weights, name_offsets = arrays
+        
+        graph = cls()
+        graph.vertices = _CSRAdjacency(_NameTable(buffer, name_offsets, position),
+                                       offsets, targets, weights)
+        return graph
+    
+    @instrumentation.timed("dijkstra")
     def dijkstra(self, start_vertex: str) -> Dict[str, Tuple[int, Optional[str]]]:
         """
         Алгоритм Дейкстри для знаходження найкоротших шляхів
@@ -57,10 +246,12 @@ class Graph:
         
         # Множина відвіданих вершин
         visited = set()
+        pops = 0
         
         while priority_queue:
             # Витягуємо вершину з мінімальною відстанню
             current_distance, current_vertex = heapq.heappop(priority_queue)
+            pops += 1
             
             # Якщо вершина вже відвідана, пропускаємо
             if current_vertex in visited:
@@ -86,6 +277,12 @@ class Graph:
                     previous[neighbor] = current_vertex
                     heapq.heappush(priority_queue, (new_distance, neighbor))
         
+        if instrumentation.ENABLED:
+            # Черга спорожнена, тому кількість додавань дорівнює кількості вилучень
+            instrumentation.count("dijkstra.heap_pushes", pops)
+            instrumentation.count("dijkstra.heap_pops", pops)
+            instrumentation.count("dijkstra.stale_skips", pops - len(visited))
+        
         return {vertex: (distances[vertex], previous[vertex]) 
                 for vertex in self.vertices}
     
@@ -100,24 +297,7 @@ class Graph:
         Returns:
             Кортеж (шлях, відстань)
         """
-        result = self.dijkstra(start_vertex)
-        
-        # Відновлюємо шлях
-        path = []
-        current = end_vertex
-        
-        while current is not None:
-            path.append(current)
-            current = result[current][1]
-        
-        path.reverse()
-        
-        # Перевіряємо, чи існує шлях
-        if path[0] != start_vertex:
-            return [], float('infinity')
-        
-        distance = result[end_vertex][0]
-        return path, distance
+        return reconstruct_path(self.dijkstra(start_vertex), start_vertex, end_vertex)
     
     def print_shortest_paths(self, start_vertex: str):
         """
@@ -144,6 +324,37 @@ class Graph:
                 print(f"До вершини {vertex}: {distance} (шлях: {path_str})")
 
 
+def reconstruct_path(result: Dict[str, Tuple[int, Optional[str]]], start_vertex: str,
+                     end_vertex: str) -> Tuple[List[str], int]:
+    """
+    Відновлює найкоротший шлях з результату Graph.dijkstra
+    
+    Args:
+        result: Результат dijkstra(start_vertex)
+        start_vertex: Початкова вершина
+        end_vertex: Кінцева вершина
+    
+    Returns:
+        Кортеж (шлях, відстань)
+    """
+    # Відновлюємо шлях
+    path = []
+    current = end_vertex
+    
+    while current is not None:
+        path.append(current)
+        current = result[current][1]
+    
+    path.reverse()
+    
+    # Перевіряємо, чи існує шлях
+    if path[0] != start_vertex:
+        return [], float('infinity')
+    
+    distance = result[end_vertex][0]
+    return path, distance
+
+
 def create_example_graph() -> Graph:
     """Створює приклад графа для демонстрації"""
     graph = Graph()
@@ -213,6 +424,18 @@ def main():
     print("\n" + "=" * 60)
     start_vertex = "D"
     graph.print_shortest_paths(start_vertex)
+    
+    # Збереження у бінарний формат CSR та завантаження через відображення у пам'ять
+    print("\n" + "=" * 60)
+    print("Збереження та завантаження графа (CSR, mmap):")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.bin")
+        graph.save(path)
+        loaded = Graph.load(path)
+        same = loaded.dijkstra("A") == graph.dijkstra("A")
+        print(f"Розмір файлу: {os.path.getsize(path)} байт")
+        print(f"Найкоротші шляхи збігаються: {'так' if same else 'ні'}")
 
 
 if __name__ == "__main__":
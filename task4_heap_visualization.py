@@ -3,80 +3,12 @@
 Побудова та візуалізація бінарної купи (heap) у вигляді дерева
 """
 
-import uuid
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
-
-
-class Node:
-    def __init__(self, key, color="skyblue"):
-        self.left = None
-        self.right = None
-        self.val = key
-        self.color = color  # Додатковий аргумент для зберігання кольору вузла
-        self.id = str(uuid.uuid4())  # Унікальний ідентифікатор для кожного вузла
-
-
-def add_edges(graph, node, pos, x=0, y=0, layer=1):
-    """Рекурсивно додає ребра та позиції вузлів до графа"""
-    if node is not None:
-        graph.add_node(node.id, color=node.color, label=node.val)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            l = add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            r = add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
-    return graph
-
-
-def draw_tree(tree_root, title="Binary Heap Visualization"):
-    """Візуалізує дерево"""
-    tree = nx.DiGraph()
-    pos = {tree_root.id: (0, 0)}
-    tree = add_edges(tree, tree_root, pos)
-
-    colors = [node[1]['color'] for node in tree.nodes(data=True)]
-    labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
-
-    plt.figure(figsize=(12, 8))
-    nx.draw(tree, pos=pos, labels=labels, arrows=False, 
-            node_size=2500, node_color=colors, font_size=10, font_weight='bold')
-    plt.title(title, fontsize=16, fontweight='bold')
-    plt.show()
-
-
-def heap_to_tree(heap_array, index=0):
-    """
-    Конвертує масив купи у бінарне дерево
-    
-    Args:
-        heap_array: Масив, що представляє купу
-        index: Поточний індекс у масиві
-    
-    Returns:
-        Node: Корінь дерева
-    """
-    if index >= len(heap_array):
-        return None
-    
-    # Створюємо вузол для поточного елемента
-    node = Node(heap_array[index])
-    
-    # Індекси лівого та правого нащадків у масиві купи
-    left_index = 2 * index + 1
-    right_index = 2 * index + 2
-    
-    # Рекурсивно створюємо ліве та праве піддерева
-    node.left = heap_to_tree(heap_array, left_index)
-    node.right = heap_to_tree(heap_array, right_index)
-    
-    return node
+import random
+import sys
+import time
+
+from tree_visualization import benchmark_node_memory, draw_tree, heap_to_tree
 
 
 def visualize_heap(heap_array, title="Binary Heap"):
@@ -131,6 +63,144 @@ def create_max_heap(elements):
     return [-x for x in inverted]
 
 
+# Розмір NumPy-фрагмента, з якого відбір виконується через np.partition
+PARTITION_THRESHOLD = 4096
+
+
+def _is_array(values):
+    """
+    Чи є values NumPy-масивом.
+    
+    NumPy не імпортується заздалегідь: якщо модуль ще не завантажено,
+    масиву NumPy у values бути не може.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+class TopK:
+    """
+    k найбільших (або найменших) значень необмеженого потоку
+    
+    Зберігає лише мін-купу з k ключів (для найменших значень - інвертованих,
+    як у create_max_heap), тому пам'ять становить O(k) незалежно від довжини
+    потоку. Кожне нове значення порівнюється з коренем купи і, якщо воно
+    краще, замінює його через heapreplace за O(log k). Великі NumPy-фрагменти
+    обробляються векторно: відсіювання за коренем купи та np.partition.
+    """
+    
+    def __init__(self, k, largest=True, partition_threshold=PARTITION_THRESHOLD):
+        """
+        Args:
+            k: Кількість значень, що зберігаються
+            largest: True - найбільші значення, False - найменші
+            partition_threshold: Мінімальний розмір NumPy-фрагмента для np.partition
+        """
+        if k < 1:
+            raise ValueError("k має бути додатним")
+        self.k = k
+        self.largest = largest
+        self.partition_threshold = partition_threshold
+        self.heap = []  # Мін-купа ключів: корінь - найгірше зі збережених значень
+        self.count = 0  # Кількість оброблених значень потоку
+    
+    def __len__(self):
+        return len(self.heap)
+    
+    def push(self, value):
+        """Додає одне значення потоку"""
+        self.count += 1
+        key = value if self.largest else -value
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, key)
+        elif key > self.heap[0]:
+            heapq.heapreplace(self.heap, key)
+    
+    def extend(self, values):
+        """
+        Додає значення з ітерованого об'єкта або NumPy-масиву
+        
+        Returns:
+            TopK: self (для ланцюжкових викликів)
+        """
+        if _is_array(values):
+            values = values.ravel()
+            if len(values) >= self.partition_threshold:
+                self._extend_array(values)
+                return self
+            values = values.tolist()
+        
+        heap, k, largest = self.heap, self.k, self.largest
+        count = 0
+        for value in values:
+            count += 1
+            key = value if largest else -value
+            if len(heap) < k:
+                heapq.heappush(heap, key)
+            elif key > heap[0]:
+                heapq.heapreplace(heap, key)
+        self.count += count
+        return self
+    
+    def _extend_array(self, values):
+        """Векторний відбір з великого фрагмента: фільтр за коренем купи та np.partition"""
+        import numpy as np
+        
+        self.count += len(values)
+        if self.largest:
+            keys = values
+        else:
+            keys = -(values.astype(np.int64) if values.dtype.kind == "u" else values)
+        
+        # Значення, не кращі за найгірше збережене, вже не потраплять у результат
+        if len(self.heap) == self.k:
+            keys = keys[keys > self.heap[0]]
+        if len(keys) == 0:
+            return
+        if len(keys) > self.k:
+            keys = np.partition(keys, len(keys) - self.k)[len(keys) - self.k:]
+        
+        merged = np.concatenate((keys, self.heap)) if self.heap else keys
+        if len(merged) > self.k:
+            merged = np.partition(merged, len(merged) - self.k)[len(merged) - self.k:]
+        self.heap = merged.tolist()
+        heapq.heapify(self.heap)
+    
+    def result(self):
+        """
+        Returns:
+            list: Збережені значення, від найкращого (найбільші - за спаданням,
+                  найменші - за зростанням)
+        """
+        keys = sorted(self.heap, reverse=True)
+        return keys if self.largest else [-key for key in keys]
+
+
+def top_k(values, k, largest=True):
+    """
+    k найбільших (або найменших) значень ітерованого об'єкта
+    
+    Args:
+        values: Ітерований об'єкт зі значеннями, NumPy-масив або
+                ітерований об'єкт з NumPy-фрагментами
+        k: Кількість значень
+        largest: True - найбільші значення, False - найменші
+    
+    Returns:
+        list: k найкращих значень, від найкращого
+    """
+    selector = TopK(k, largest)
+    if _is_array(values):
+        return selector.extend(values).result()
+    
+    for value in values:
+        if _is_array(value):
+            selector.extend(value)
+        else:
+            selector.push(value)
+    return selector.result()
+
+
 def demonstrate_heap_operations():
     """Демонструє операції з купою та їх візуалізацію"""
     print("=" * 60)
@@ -176,7 +246,6 @@ def demonstrate_heap_operations():
     # Приклад 5: Купа з більшої кількості елементів
     print("\n5. Візуалізація більшої купи")
     large_elements = list(range(1, 16))  # 1-15
-    import random
     random.shuffle(large_elements)
     print(f"   Вхідні дані: {large_elements}")
     
@@ -185,6 +254,41 @@ def demonstrate_heap_operations():
     visualize_heap(large_heap, "Large Min Heap (15 elements)")
 
 
+def demonstrate_top_k():
+    """Демонструє відбір k найбільших значень потоку з пам'яттю O(k)"""
+    import numpy as np
+    
+    print("\n" + "=" * 60)
+    print("Top-k для потоку даних")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(42)
+    chunks = [rng.random(100_000) for _ in range(20)]
+    k = 10
+    
+    start = time.perf_counter()
+    largest = top_k(chunks, k)
+    chunked_time = time.perf_counter() - start
+    
+    values = np.concatenate(chunks).tolist()
+    start = time.perf_counter()
+    scalar = top_k(iter(values), k)
+    scalar_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    full_heap = create_max_heap(values)
+    expected = [-x for x in heapq.nsmallest(k, (-x for x in full_heap))]
+    full_time = time.perf_counter() - start
+    
+    print(f"Потік: {len(values):,} значень, k = {k}")
+    print(f"Найбільші: {[round(x, 6) for x in largest[:5]]}...")
+    print(f"Найменші:  {[round(x, 6) for x in top_k(chunks, 5, largest=False)]}")
+    print(f"NumPy-фрагменти (np.partition): {chunked_time * 1000:8.1f} мс")
+    print(f"Поелементно (heapreplace):      {scalar_time * 1000:8.1f} мс")
+    print(f"Повна макс-купа:                {full_time * 1000:8.1f} мс")
+    print(f"Результати збігаються: {'так' if largest == scalar == expected else 'ні'}")
+
+
 def custom_heap_example():
     """Приклад створення користувацької купи"""
     print("\n" + "=" * 60)
@@ -202,6 +306,8 @@ def main():
     """Головна функція"""
     demonstrate_heap_operations()
     custom_heap_example()
+    demonstrate_top_k()
+    benchmark_node_memory()
     
     print("\n" + "=" * 60)
     print("Візуалізація завершена!")
@@ -4,20 +4,11 @@
 з використанням стеку та черги (БЕЗ рекурсії)
 """
 
-import uuid
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
 from collections import deque
 
-
-class Node:
-    def __init__(self, key, color="#000000"):
-        self.left = None
-        self.right = None
-        self.val = key
-        self.color = color
-        self.id = str(uuid.uuid4())
+import instrumentation
+import tree_visualization
 
 
 def generate_color_gradient(step, total_steps):
@@ -43,6 +34,7 @@ def generate_color_gradient(step, total_steps):
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+@instrumentation.timed("depth_first_search")
 def depth_first_search(root):
     """
     Обхід дерева у глибину (DFS) з використанням стеку
@@ -70,9 +62,13 @@ def depth_first_search(root):
         if node.left:
             stack.append(node.left)
     
+    if instrumentation.ENABLED:
+        instrumentation.count("depth_first_search.nodes_visited", len(visited))
+    
     return visited
 
 
+@instrumentation.timed("breadth_first_search")
 def breadth_first_search(root):
     """
     Обхід дерева в ширину (BFS) з використанням черги
@@ -100,6 +96,9 @@ def breadth_first_search(root):
         if node.right:
             queue.append(node.right)
     
+    if instrumentation.ENABLED:
+        instrumentation.count("breadth_first_search.nodes_visited", len(visited))
+    
     return visited
 
 
@@ -115,23 +114,6 @@ def assign_colors_to_traversal(nodes):
         node.color = generate_color_gradient(i, total_nodes)
 
 
-def add_edges(graph, node, pos, x=0, y=0, layer=1):
-    """Рекурсивно додає ребра та позиції вузлів до графа"""
-    if node is not None:
-        graph.add_node(node.id, color=node.color, label=node.val)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
-    return graph
-
-
 def draw_tree(tree_root, title="Binary Tree Traversal"):
     """
     Візуалізує дерево з кольорами
@@ -140,19 +122,7 @@ def draw_tree(tree_root, title="Binary Tree Traversal"):
         tree_root: Корінь дерева
         title: Заголовок візуалізації
     """
-    tree = nx.DiGraph()
-    pos = {tree_root.id: (0, 0)}
-    tree = add_edges(tree, tree_root, pos)
-
-    colors = [node[1]['color'] for node in tree.nodes(data=True)]
-    labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
-
-    plt.figure(figsize=(12, 8))
-    nx.draw(tree, pos=pos, labels=labels, arrows=False,
-            node_size=2500, node_color=colors, font_size=10, 
-            font_weight='bold', font_color='white')
-    plt.title(title, fontsize=16, fontweight='bold')
-    plt.show()
+    tree_visualization.draw_tree(tree_root, title, font_color='white')
 
 
 def heap_to_tree(heap_array, index=0):
@@ -166,18 +136,7 @@ def heap_to_tree(heap_array, index=0):
     Returns:
         Node: Корінь дерева
     """
-    if index >= len(heap_array):
-        return None
-    
-    node = Node(heap_array[index])
-    
-    left_index = 2 * index + 1
-    right_index = 2 * index + 2
-    
-    node.left = heap_to_tree(heap_array, left_index)
-    node.right = heap_to_tree(heap_array, right_index)
-    
-    return node
+    return tree_visualization.heap_to_tree(heap_array, index, color="#000000")
 
 
 def visualize_dfs(root):
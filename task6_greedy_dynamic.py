@@ -3,6 +3,19 @@
 Реалізовано два підходи: жадібний алгоритм та динамічне програмування.
 """
 
+import hashlib
+import math
+import random
+import time
+import tracemalloc
+from collections import OrderedDict
+
+import numpy as np
+
+import instrumentation
+
+
+@instrumentation.timed("greedy_algorithm")
 def greedy_algorithm(items, budget):
     """
     Жадібний алгоритм для вибору страв з максимальною калорійністю.
@@ -40,61 +53,765 @@ def greedy_algorithm(items, budget):
     return selected_items, total_cost, total_calories
 
 
-def dynamic_programming(items, budget):
+# Максимальна кількість страв у блоці, для якого відновлення виконується
+# за бітовою матрицею рішень (64 рядки по budget/8 байт = один рядок int64)
+_LEAF_SIZE = 64
+
+# У режимі "auto" розріджений метод обирається, якщо оцінка фронту Парето
+# менша за щільний рядок DP щонайменше в стільки разів (стан фронту
+# обробляється сортуванням і коштує дорожче за клітинку щільного рядка)
+_SPARSE_FACTOR = 16
+
+# Кеш solve_many: відбиток меню -> (рядок DP, бітова матриця рішень або None)
+_SOLVE_MANY_CACHE = OrderedDict()
+_SOLVE_MANY_CACHE_SIZE = 8
+
+
+def _knapsack_row_update(row, cost, calories):
+    """
+    Оновлює один рядок DP для страви (векторизовано через NumPy).
+
+    Для кожного бюджету w >= cost порівнює row[w] з row[w - cost] + calories
+    і записує більше значення. Зсунутий зріз обчислюється до запису,
+    тому кожна страва береться не більше одного разу.
+
+    Args:
+        row: одновимірний масив NumPy з максимальними калоріями для кожного бюджету
+        cost: вартість страви
+        calories: калорійність страви
+
+    Returns:
+        numpy.ndarray: булева маска довжини len(row) - True там, де страву взято
+    """
+    take = np.zeros(len(row), dtype=bool)
+    if cost >= len(row):
+        return take
+    
+    if instrumentation.ENABLED:
+        instrumentation.count("dynamic_programming.cells_filled", len(row) - cost)
+
+    candidate = row[:len(row) - cost] + calories
+    # Беремо страву лише за строгого покращення - так само, як і в
+    # класичному відновленні за таблицею (dp[i][w] != dp[i - 1][w])
+    take[cost:] = candidate > row[cost:]
+    np.maximum(row[cost:], candidate, out=row[cost:])
+    return take
+
+
+def _knapsack_forward(items_list, lo, hi, row):
+    """Прямий прохід DP по стравах [lo, hi) без збереження рішень (змінює row)"""
+    for _, data in items_list[lo:hi]:
+        cost = data["cost"]
+        if cost < len(row):
+            if instrumentation.ENABLED:
+                instrumentation.count("dynamic_programming.cells_filled", len(row) - cost)
+            np.maximum(row[cost:], row[:len(row) - cost] + data["calories"],
+                       out=row[cost:])
+
+
+def _build_decisions(items_list, lo, hi, row):
+    """
+    Прямий прохід DP по стравах [lo, hi) зі збереженням бітової матриці рішень.
+
+    Returns:
+        numpy.ndarray: матриця (hi - lo)×ceil(len(row) / 8), упакована np.packbits
+    """
+    decisions = np.zeros((hi - lo, (len(row) + 7) // 8), dtype=np.uint8)
+    for i in range(lo, hi):
+        data = items_list[i][1]
+        decisions[i - lo] = np.packbits(
+            _knapsack_row_update(row, data["cost"], data["calories"]))
+    return decisions
+
+
+def _trace_decisions(items_list, decisions, lo, hi, w, selected):
+    """Відновлює обрані страви [lo, hi) за бітовою матрицею, починаючи з бюджету w"""
+    for i in range(hi - 1, lo - 1, -1):
+        # Біт рішення для бюджету w (порядок бітів у np.packbits - big-endian)
+        if (decisions[i - lo, w >> 3] >> (7 - (w & 7))) & 1:
+            selected.append(i)
+            w -= items_list[i][1]["cost"]
+    return w
+
+
+def _trace_budget(items_list, lo, hi, row, w):
+    """
+    Прямий прохід DP по стравах [lo, hi) (змінює row), який заодно визначає,
+    з яким бюджетом відновлення за бітовою матрицею дійшло б до страви lo,
+    почавши з бюджету w після страви hi - 1.
+
+    Замість матриці рішень зберігається композиція кроків відновлення:
+    origin[v] - бюджет перед стравою lo, якщо перед поточною стравою
+    залишався бюджет v. Пам'ять - O(len(row)).
+
+    Returns:
+        int: бюджет, що залишився для страв [0, lo)
+    """
+    budgets = np.arange(len(row))
+    origin = budgets.copy()
+    for i in range(lo, hi):
+        data = items_list[i][1]
+        take = _knapsack_row_update(row, data["cost"], data["calories"])
+        if data["cost"] < len(row):
+            # Крок відновлення: якщо страву взято, бюджет зменшується на її вартість
+            origin = origin[budgets - data["cost"] * take]
+    return int(origin[w])
+
+
+def _trace_block(items_list, lo, hi, w, selected, leaf_size, dtype):
+    """
+    Відновлює рішення для страв [lo, hi) з бюджетом w (схема Гіршберга).
+
+    Відновлення за бітовою матрицею обирає серед оптимальних наборів той,
+    що не бере страви з більшими індексами, коли це можливо. Тому після
+    визначення бюджету w_mid, з яким відновлення доходить до середини блоку,
+    обидві половини - незалежні задачі з нульовим початковим рядком:
+    права з бюджетом w - w_mid, ліва з бюджетом w_mid. Набір страв
+    збігається з режимом "bits", а рядки звільняються до рекурсії.
+
+    Args:
+        items_list: список страв [(назва, дані)]
+        lo, hi: межі блоку страв
+        w: бюджет блоку
+        selected: список, до якого додаються індекси обраних страв (з кінця)
+        leaf_size: розмір блоку, який відновлюється за бітовою матрицею
+        dtype: тип значень рядка DP
+    """
+    if hi - lo <= leaf_size:
+        row = np.zeros(w + 1, dtype=dtype)
+        decisions = _build_decisions(items_list, lo, hi, row)
+        _trace_decisions(items_list, decisions, lo, hi, w, selected)
+        return
+
+    mid = (lo + hi) // 2
+    row = np.zeros(w + 1, dtype=dtype)
+    _knapsack_forward(items_list, lo, mid, row)
+    w_mid = _trace_budget(items_list, mid, hi, row, w)
+    del row
+
+    # Спочатку права половина, бо індекси додаються з кінця
+    _trace_block(items_list, mid, hi, w - w_mid, selected, leaf_size, dtype)
+    _trace_block(items_list, lo, mid, w_mid, selected, leaf_size, dtype)
+
+
+def _pareto_knapsack(items_list, budget):
+    """
+    Розріджений розв'язок задачі про рюкзак через фронт Парето.
+
+    Зберігає лише недоміновані стани (вартість, калорії): стан домінований,
+    якщо існує інший стан з не більшою вартістю і не меншою калорійністю.
+    Після кожної страви фронт об'єднується зі зсунутою копією і проріджується,
+    тому час залежить від розміру фронту, а не від значення бюджету.
+
+    Фронт після кожної страви задає той самий рядок DP, що й щільний метод
+    (максимум калорій для бюджету w - останній стан з вартістю <= w), тому
+    відновлення повторює бітову матрицю: страву взято, якщо вона строго
+    покращує значення для залишку бюджету. Набір страв збігається з "bits".
+
+    Args:
+        items_list: список страв [(назва, дані)]
+        budget: доступний бюджет
+
+    Returns:
+        list: індекси обраних страв у порядку зростання
+    """
+    # Фронт: вартості за зростанням, калорії строго зростають
+    costs = np.zeros(1, dtype=np.int64)
+    values = np.zeros(1, dtype=_calories_dtype(data["calories"] for _, data in items_list))
+    # Фронти до першої страви і після кожної з них
+    frontiers = [(costs, values)]
+
+    for _, data in items_list:
+        fits = np.flatnonzero(costs + data["cost"] <= budget)
+        cand_costs = np.concatenate((costs, costs[fits] + data["cost"]))
+        cand_values = np.concatenate((values, values[fits] + data["calories"]))
+        cand_taken = np.concatenate((np.zeros(len(costs), dtype=bool),
+                                     np.ones(len(fits), dtype=bool)))
+
+        # Сортуємо за вартістю, далі - за спаданням калорій; за повного
+        # збігу перевага стану без поточної страви
+        order = np.lexsort((cand_taken, -cand_values, cand_costs))
+        cand_values = cand_values[order]
+
+        # Залишаємо стани, калорійність яких строго більша за всі дешевші
+        best_before = np.maximum.accumulate(cand_values)
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:] = cand_values[1:] > best_before[:-1]
+
+        order = order[keep]
+        if instrumentation.ENABLED:
+            instrumentation.count("dynamic_programming.frontier_states", len(order))
+        costs = cand_costs[order]
+        values = cand_values[keep]
+        frontiers.append((costs, values))
+
+    def best(frontier, w):
+        # Значення рядка DP для бюджету w: стан з нульовою вартістю є завжди
+        frontier_costs, frontier_values = frontier
+        return frontier_values[np.searchsorted(frontier_costs, w, side="right") - 1]
+
+    selected = []
+    w = budget
+    for i in range(len(items_list) - 1, -1, -1):
+        if best(frontiers[i + 1], w) > best(frontiers[i], w):
+            selected.append(i)
+            w -= items_list[i][1]["cost"]
+
+    selected.reverse()
+    return selected
+
+
+def _calories_dtype(calories):
+    """Тип NumPy для значень DP: int64 для цілих калорій, інакше float64"""
+    if all(isinstance(value, (int, np.integer)) for value in calories):
+        return np.int64
+    return np.float64
+
+
+def _estimate_frontier_size(items_list, budget):
+    """
+    Оцінює зверху розмір фронту Парето.
+
+    Вартості станів кратні НСД вартостей страв і не перевищують бюджет,
+    калорійності - різні і (для цілих калорій) не перевищують суму калорій,
+    а кількість підмножин не перевищує 2^n.
+    """
+    step = 0
+    total_calories = 0
+    for _, data in items_list:
+        step = math.gcd(step, data["cost"])
+        total_calories += data["calories"]
+
+    by_cost = budget // step + 1 if step else 1
+    by_subsets = 2 ** len(items_list) if len(items_list) < 63 else by_cost
+    if _calories_dtype(data["calories"] for _, data in items_list) is np.float64:
+        return min(by_cost, by_subsets)
+    return min(by_cost, total_calories + 1, by_subsets)
+
+
+@instrumentation.timed("dynamic_programming")
+def dynamic_programming(items, budget, reconstruction="bits", method="auto"):
     """
     Алгоритм динамічного програмування для вибору оптимального набору страв.
     
     Використовує підхід задачі про рюкзак (knapsack problem) для знаходження
     оптимального розв'язку, який максимізує калорійність при заданому бюджеті.
+
+    Замість повної таблиці (n+1)×(budget+1) зберігається лише один рядок
+    значень NumPy, який оновлюється зсунутими зрізами для кожної страви.
+    Для відновлення набору зберігається бітова матриця рішень
+    (1 біт на клітинку замість 64-бітного числа), упакована через np.packbits.
+
+    У режимі reconstruction="divide" список страв рекурсивно ділиться навпіл
+    (за схемою Гіршберга): прямий прохід визначає, як бюджет ділиться між
+    половинами, і кожна половина розв'язується окремо з власним бюджетом;
+    бітова матриця будується лише для блоків до 64 страв. Пам'ять - O(budget)
+    замість O(n · budget) бітів, час - O(n · budget). Набір страв збігається
+    з режимом "bits".
+
+    Метод method="sparse" зберігає лише фронт Парето станів (вартість, калорії)
+    і підходить для великих розріджених бюджетів (наприклад, ціни в центах).
+    У режимі "auto" він обирається, якщо оцінка розміру фронту значно менша
+    за щільний рядок DP. Набір страв збігається зі щільним методом.
     
     Args:
         items: словник з стравами {назва: {"cost": вартість, "calories": калорії}}
         budget: доступний бюджет
+        reconstruction: спосіб відновлення набору - "bits" або "divide"
+                        (для методу "sparse" не використовується)
+        method: "dense", "sparse" або "auto"
     
     Returns:
         tuple: (список обраних страв, загальна вартість, загальні калорії)
     """
+    if reconstruction not in ("bits", "divide"):
+        raise ValueError(f"Невідомий спосіб відновлення: {reconstruction}")
+    if method not in ("auto", "dense", "sparse"):
+        raise ValueError(f"Невідомий метод: {method}")
+
     # Перетворюємо словник у список для зручності індексації
     items_list = list(items.items())
     n = len(items_list)
+
+    if method == "auto":
+        frontier = _estimate_frontier_size(items_list, budget)
+        method = "sparse" if frontier * _SPARSE_FACTOR < budget + 1 else "dense"
     
-    # Створюємо таблицю DP: dp[i][w] - максимальні калорії для перших i страв з бюджетом w
-    dp = [[0 for _ in range(budget + 1)] for _ in range(n + 1)]
-    
-    # Заповнюємо таблицю DP
-    for i in range(1, n + 1):
-        name, data = items_list[i - 1]
-        cost = data["cost"]
-        calories = data["calories"]
-        
-        for w in range(budget + 1):
-            # Не беремо поточну страву
-            dp[i][w] = dp[i - 1][w]
-            
-            # Беремо поточну страву, якщо вона поміщається в бюджет
-            if cost <= w:
-                dp[i][w] = max(dp[i][w], dp[i - 1][w - cost] + calories)
-    
-    # Відновлюємо набір обраних страв
-    selected_items = []
-    w = budget
-    total_calories = dp[n][budget]
-    
-    for i in range(n, 0, -1):
-        # Якщо значення змінилось, значить ми взяли цю страву
-        if dp[i][w] != dp[i - 1][w]:
-            name, data = items_list[i - 1]
-            selected_items.append(name)
-            w -= data["cost"]
+    if method == "sparse":
+        selected = _pareto_knapsack(items_list, budget)
+    else:
+        # Відновлюємо набір обраних страв (індекси додаються з кінця)
+        leaf_size = n if reconstruction == "bits" else _LEAF_SIZE
+        selected = []
+        _trace_block(items_list, 0, n, budget, selected, leaf_size,
+                     _calories_dtype(data["calories"] for _, data in items_list))
+        selected.reverse()
     
-    selected_items.reverse()
+    selected_items = [items_list[i][0] for i in selected]
     
-    # Обчислюємо загальну вартість
+    # Обчислюємо загальну вартість і калорійність
     total_cost = sum(items[name]["cost"] for name in selected_items)
+    total_calories = sum(items[name]["calories"] for name in selected_items)
     
     return selected_items, total_cost, total_calories
 
 
+def _items_fingerprint(items):
+    """Відбиток меню: хеш від назв, вартостей і калорійностей страв у їх порядку"""
+    digest = hashlib.sha1()
+    for name, data in items.items():
+        digest.update(repr((name, data["cost"], data["calories"])).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@instrumentation.timed("solve_many")
+def solve_many(items, budgets, reconstruct=False):
+    """
+    Розв'язує задачу для багатьох бюджетів одним проходом DP.
+
+    DP виконується один раз до max(budgets), і відповідь для кожного бюджету
+    береться з останнього рядка. Рядок (і за потреби бітова матриця рішень)
+    кешується за відбитком меню, тому повторні запити для того ж меню
+    з бюджетами не більшими за вже обчислений - це пошук у кеші.
+
+    Args:
+        items: словник з стравами {назва: {"cost": вартість, "calories": калорії}}
+        budgets: послідовність бюджетів
+        reconstruct: чи відновлювати набори страв
+
+    Returns:
+        dict: {бюджет: калорії} або, якщо reconstruct=True,
+              {бюджет: (список обраних страв, загальна вартість, загальні калорії)}
+    """
+    budgets = list(budgets)
+    if not budgets:
+        return {}
+
+    items_list = list(items.items())
+    max_budget = max(budgets)
+    key = _items_fingerprint(items)
+
+    cached = _SOLVE_MANY_CACHE.get(key)
+    if (cached is None or len(cached[0]) <= max_budget
+            or (reconstruct and cached[1] is None)):
+        row = np.zeros(max_budget + 1,
+                       dtype=_calories_dtype(data["calories"] for _, data in items_list))
+        if reconstruct:
+            decisions = _build_decisions(items_list, 0, len(items_list), row)
+        else:
+            decisions = None
+            _knapsack_forward(items_list, 0, len(items_list), row)
+        cached = (row, decisions)
+        _SOLVE_MANY_CACHE[key] = cached
+        while len(_SOLVE_MANY_CACHE) > _SOLVE_MANY_CACHE_SIZE:
+            _SOLVE_MANY_CACHE.popitem(last=False)
+    else:
+        _SOLVE_MANY_CACHE.move_to_end(key)
+
+    row, decisions = cached
+    if not reconstruct:
+        return {budget: row[budget].item() for budget in budgets}
+
+    results = {}
+    for budget in budgets:
+        selected = []
+        _trace_decisions(items_list, decisions, 0, len(items_list), budget, selected)
+        selected_items = [items_list[i][0] for i in reversed(selected)]
+        total_cost = sum(items[name]["cost"] for name in selected_items)
+        results[budget] = (selected_items, total_cost, row[budget].item())
+    return results
+
+
+def _fractional_bound(sorted_items, index, cost, calories, budget):
+    """
+    Верхня межа калорійності (дробова релаксація, як у жадібному алгоритмі).
+
+    Страви, починаючи з index, додаються за спаданням співвідношення
+    калорій до вартості, а першу страву, що не поміщається, беремо частково.
+    """
+    bound = calories
+    remaining = budget - cost
+    for _, item_cost, item_calories, _ in sorted_items[index:]:
+        if item_cost <= remaining:
+            remaining -= item_cost
+            bound += item_calories
+        else:
+            bound += item_calories * remaining / item_cost
+            break
+    return bound
+
+
+@instrumentation.timed("branch_and_bound")
+def branch_and_bound(items, budget, time_limit=None):
+    """
+    Точний метод гілок і меж для вибору оптимального набору страв.
+
+    Страви сортуються за співвідношенням калорій до вартості (як у
+    greedy_algorithm). Верхня межа гілки - дробова жадібна релаксація,
+    початковий рекорд - розв'язок greedy_algorithm. Обхід у глибину
+    виконується зі стеком (без рекурсії), спочатку гілка "беремо страву".
+
+    Якщо задано time_limit і час вичерпано, повертається найкращий
+    знайдений набір та відносний розрив до верхньої межі.
+
+    Args:
+        items: словник з стравами {назва: {"cost": вартість, "calories": калорії}}
+        budget: доступний бюджет
+        time_limit: обмеження часу в секундах (None - без обмеження)
+
+    Returns:
+        tuple: (список обраних страв, загальна вартість, загальні калорії,
+                розрив оптимальності: 0.0 - доведено оптимальний розв'язок)
+    """
+    order = {name: i for i, name in enumerate(items)}
+    sorted_items = [(name, data["cost"], data["calories"], data["calories"] / data["cost"])
+                    for name, data in items.items()]
+    sorted_items.sort(key=lambda x: x[3], reverse=True)
+    n = len(sorted_items)
+
+    # Початковий рекорд - жадібний розв'язок
+    greedy_items, _, best_calories = greedy_algorithm(items, budget)
+    best_items = greedy_items
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    root_bound = _fractional_bound(sorted_items, 0, 0, 0, budget)
+
+    # Стек: (межа, індекс страви, вартість, калорії, обрані страви як зв'язний кортеж)
+    stack = [(root_bound, 0, 0, 0, None)]
+    expanded = 0
+    timed_out = False
+
+    while stack:
+        bound, index, cost, calories, chosen = stack.pop()
+
+        # Відсікаємо гілки, які не можуть покращити рекорд
+        if bound <= best_calories:
+            continue
+
+        if calories > best_calories:
+            best_calories = calories
+            best_items = []
+            link = chosen
+            while link is not None:
+                name, link = link
+                best_items.append(name)
+
+        if index == n:
+            continue
+
+        expanded += 1
+        if deadline is not None and expanded % 1024 == 0 and time.perf_counter() > deadline:
+            stack.append((bound, index, cost, calories, chosen))
+            timed_out = True
+            break
+
+        name, item_cost, item_calories, _ = sorted_items[index]
+
+        # Гілка "не беремо страву"
+        exclude_bound = _fractional_bound(sorted_items, index + 1, cost, calories, budget)
+        if exclude_bound > best_calories:
+            stack.append((exclude_bound, index + 1, cost, calories, chosen))
+
+        # Гілка "беремо страву" (межа не змінюється, тому обробляється першою)
+        if cost + item_cost <= budget:
+            stack.append((bound, index + 1, cost + item_cost, calories + item_calories,
+                          (name, chosen)))
+
+    gap = 0.0
+    if timed_out:
+        upper = max((entry[0] for entry in stack), default=best_calories)
+        if upper > best_calories:
+            gap = (upper - best_calories) / upper
+
+    selected_items = sorted(best_items, key=order.__getitem__)
+    total_cost = sum(items[name]["cost"] for name in selected_items)
+
+    return selected_items, total_cost, best_calories, gap
+
+
+def _split_quantities(items, dimensions):
+    """
+    Двійкове розбиття кількостей страв на 0/1-частини.
+
+    Страва з кількістю q перетворюється на частини 1, 2, 4, ..., залишок,
+    з яких можна скласти будь-яку кількість від 0 до q. Тому обмежені
+    кількості збільшують кількість частин лише логарифмічно.
+
+    Args:
+        items: словник з стравами (може містити "quantity" та "category")
+        dimensions: список вимірів (назва ресурсу або ("category", категорія))
+
+    Returns:
+        list: [(назва, кількість, вектор ресурсів, калорії)]
+    """
+    chunks = []
+    for name, data in items.items():
+        usage = []
+        for dimension in dimensions:
+            if isinstance(dimension, tuple):
+                usage.append(1 if data.get("category") == dimension[1] else 0)
+            else:
+                usage.append(data.get(dimension, 0))
+
+        quantity = data.get("quantity", 1)
+        part = 1
+        while quantity > 0:
+            count = min(part, quantity)
+            chunks.append((name, count, tuple(u * count for u in usage),
+                           data["calories"] * count))
+            quantity -= count
+            part *= 2
+    return chunks
+
+
+def _chunks_result(chunks, taken, dimensions):
+    """Перетворює обрані частини на (кількості страв, використані ресурси, калорії)"""
+    selected = {}
+    usage = [0] * len(dimensions)
+    total_calories = 0
+    for index in taken:
+        name, count, chunk_usage, calories = chunks[index]
+        selected[name] = selected.get(name, 0) + count
+        usage = [u + c for u, c in zip(usage, chunk_usage)]
+        total_calories += calories
+
+    usage_by_name = {}
+    for dimension, used in zip(dimensions, usage):
+        key = f"category:{dimension[1]}" if isinstance(dimension, tuple) else dimension
+        usage_by_name[key] = used
+    return selected, usage_by_name, total_calories
+
+
+def _multi_dynamic_programming(chunks, capacities):
+    """
+    Багатовимірний 0/1 DP над масивом NumPy розміру (L1+1)×(L2+1)×...
+
+    Returns:
+        list: індекси обраних частин
+    """
+    shape = tuple(c + 1 for c in capacities)
+    table = np.zeros(shape, dtype=_calories_dtype(chunk[3] for chunk in chunks))
+    decisions = []
+
+    for _, _, usage, calories in chunks:
+        take = np.zeros(shape, dtype=bool)
+        if all(u <= c for u, c in zip(usage, capacities)):
+            target = tuple(slice(u, None) for u in usage)
+            source = tuple(slice(0, s - u) for u, s in zip(usage, shape))
+            candidate = table[source] + calories
+            take[target] = candidate > table[target]
+            np.maximum(table[target], candidate, out=table[target])
+        decisions.append(np.packbits(take))
+
+    taken = []
+    state = list(capacities)
+    for i in range(len(chunks) - 1, -1, -1):
+        flat = int(np.ravel_multi_index(tuple(state), shape))
+        if (decisions[i][flat >> 3] >> (7 - (flat & 7))) & 1:
+            taken.append(i)
+            state = [s - u for s, u in zip(state, chunks[i][2])]
+    taken.reverse()
+    return taken
+
+
+def _multi_branch_and_bound(chunks, capacities, time_limit=None):
+    """
+    Багатовимірний метод гілок і меж для 0/1-частин.
+
+    Верхня межа - мінімум дробових релаксацій по кожному виміру окремо
+    (кожна з них ігнорує інші обмеження, тому є допустимою межею).
+
+    Returns:
+        tuple: (індекси обраних частин, розрив оптимальності)
+    """
+    n = len(chunks)
+    dims = len(capacities)
+
+    def weight(chunk):
+        return sum(u / c if c else (math.inf if u else 0.0)
+                   for u, c in zip(chunk[2], capacities))
+
+    # Порядок обходу - за калоріями на одиницю нормованих ресурсів
+    order = sorted(range(n), key=lambda i: chunks[i][3] / (weight(chunks[i]) or 1e-12),
+                   reverse=True)
+    ordered = [chunks[i] for i in order]
+    # Для кожного виміру - позиції у порядку спадання калорій на одиницю ресурсу
+    by_dimension = [
+        sorted(range(n), key=lambda i, d=d: (ordered[i][3] / ordered[i][2][d]
+                                             if ordered[i][2][d] else math.inf),
+               reverse=True)
+        for d in range(dims)
+    ]
+
+    def bound(index, remaining, calories):
+        best = math.inf
+        for d in range(dims):
+            value = calories
+            room = remaining[d]
+            for i in by_dimension[d]:
+                if i < index:
+                    continue
+                use, gain = ordered[i][2][d], ordered[i][3]
+                if use <= room:
+                    room -= use
+                    value += gain
+                else:
+                    value += gain * room / use
+                    break
+            best = min(best, value)
+        if not dims:
+            best = calories + sum(chunk[3] for chunk in ordered[index:])
+        return best
+
+    # Початковий рекорд - жадібний вибір у порядку обходу
+    remaining = list(capacities)
+    best_taken, best_calories = [], 0
+    for i, (_, _, usage, calories) in enumerate(ordered):
+        if all(u <= r for u, r in zip(usage, remaining)):
+            remaining = [r - u for r, u in zip(remaining, usage)]
+            best_taken.append(i)
+            best_calories += calories
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    stack = [(bound(0, capacities, 0), 0, tuple(capacities), 0, None)]
+    expanded = 0
+    timed_out = False
+
+    while stack:
+        node_bound, index, remaining, calories, chosen = stack.pop()
+        if node_bound <= best_calories:
+            continue
+
+        if calories > best_calories:
+            best_calories = calories
+            best_taken = []
+            link = chosen
+            while link is not None:
+                position, link = link
+                best_taken.append(position)
+
+        if index == n:
+            continue
+
+        expanded += 1
+        if deadline is not None and expanded % 1024 == 0 and time.perf_counter() > deadline:
+            stack.append((node_bound, index, remaining, calories, chosen))
+            timed_out = True
+            break
+
+        usage, gain = ordered[index][2], ordered[index][3]
+        exclude_bound = bound(index + 1, remaining, calories)
+        if exclude_bound > best_calories:
+            stack.append((exclude_bound, index + 1, remaining, calories, chosen))
+
+        if all(u <= r for u, r in zip(usage, remaining)):
+            left = tuple(r - u for r, u in zip(remaining, usage))
+            include_bound = bound(index + 1, left, calories + gain)
+            if include_bound > best_calories:
+                stack.append((include_bound, index + 1, left, calories + gain,
+                              (index, chosen)))
+
+    gap = 0.0
+    if timed_out:
+        upper = max((entry[0] for entry in stack), default=best_calories)
+        if upper > best_calories:
+            gap = (upper - best_calories) / upper
+
+    return sorted(order[i] for i in best_taken), gap
+
+
+@instrumentation.timed("optimize_menu")
+def optimize_menu(items, limits, max_memory_bytes=256 * 1024 * 1024, time_limit=None):
+    """
+    Оптимізація меню з кількома обмеженнями та обмеженими кількостями страв.
+
+    Узагальнення dynamic_programming: кожен ресурс у limits (вартість, вага,
+    час приготування тощо) і кожне обмеження кількості страв категорії -
+    окремий вимір стану DP. Кількість страви ("quantity", за замовчуванням 1)
+    розбивається двійково, тож обмежені кількості не множать розмір DP.
+
+    Розмір стану DP визначається самими обмеженнями: (L1+1)×(L2+1)×...
+    Якщо оцінка пам'яті щільного DP перевищує max_memory_bytes,
+    використовується метод гілок і меж (з можливим обмеженням часу).
+
+    Args:
+        items: {назва: {"calories": калорії, "cost": ..., "weight": ...,
+                "category": категорія, "quantity": максимальна кількість}}
+        limits: {"cost": ліміт, "weight": ліміт, ..., "categories": {категорія: ліміт}}
+        max_memory_bytes: ліміт пам'яті щільного DP
+        time_limit: обмеження часу для методу гілок і меж (секунди)
+
+    Returns:
+        tuple: (словник {назва: кількість}, словник використаних ресурсів,
+                загальні калорії, розрив оптимальності)
+    """
+    dimensions = [name for name in limits if name != "categories"]
+    dimensions += [("category", category) for category in limits.get("categories", {})]
+    capacities = [limits[d] if not isinstance(d, tuple) else limits["categories"][d[1]]
+                  for d in dimensions]
+
+    chunks = _split_quantities(items, dimensions)
+
+    states = math.prod(c + 1 for c in capacities)
+    # Рядок int64, тимчасові масиви (кандидати та маска) і бітова матриця рішень
+    estimated_bytes = states * 17 + len(chunks) * ((states + 7) // 8)
+
+    if estimated_bytes <= max_memory_bytes:
+        taken, gap = _multi_dynamic_programming(chunks, capacities), 0.0
+    else:
+        taken, gap = _multi_branch_and_bound(chunks, capacities, time_limit)
+
+    selected, usage, total_calories = _chunks_result(chunks, taken, dimensions)
+    return selected, usage, total_calories, gap
+
+
+def generate_random_items(n, max_cost=100, max_calories=1000, seed=None):
+    """
+    Генерує випадкове меню з n страв.
+
+    Args:
+        n: кількість страв
+        max_cost: максимальна вартість страви
+        max_calories: максимальна калорійність страви
+        seed: зерно генератора для відтворюваності
+
+    Returns:
+        dict: словник з стравами {назва: {"cost": вартість, "calories": калорії}}
+    """
+    rng = random.Random(seed)
+    return {
+        f"item-{i}": {"cost": rng.randint(1, max_cost),
+                      "calories": rng.randint(1, max_calories)}
+        for i in range(n)
+    }
+
+
+def benchmark_reconstruction_memory(n_items=2000, budgets=(1_000, 10_000, 50_000), seed=42):
+    """
+    Порівнює пікову пам'ять (tracemalloc) режимів відновлення "bits" та "divide"
+    для різних бюджетів.
+
+    Returns:
+        list: [(бюджет, пам'ять bits у байтах, пам'ять divide у байтах)]
+    """
+    items = generate_random_items(n_items, seed=seed)
+    results = []
+
+    print(f"\n{'Бюджет':>10} {'bits, КБ':>12} {'divide, КБ':>12}")
+    print("-" * 40)
+    for budget in budgets:
+        peaks = []
+        for reconstruction in ("bits", "divide"):
+            tracemalloc.start()
+            dynamic_programming(items, budget, reconstruction=reconstruction)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        results.append((budget, peaks[0], peaks[1]))
+        print(f"{budget:>10} {peaks[0] / 1024:>12.1f} {peaks[1] / 1024:>12.1f}")
+
+    return results
+
+
 def main():
     """Головна функція для демонстрації роботи алгоритмів."""
     
@@ -181,6 +898,46 @@ def main():
     print(f"\nДинамічне програмування (бюджет {budget2}):")
     print(f"  Страви: {', '.join(dp_items2)}")
     print(f"  Калорії: {dp_calories2}, Вартість: {dp_cost2}")
+    
+    bb_items2, bb_cost2, bb_calories2, bb_gap2 = branch_and_bound(items, budget2)
+    
+    print(f"\nМетод гілок і меж (бюджет {budget2}):")
+    print(f"  Страви: {', '.join(bb_items2)}")
+    print(f"  Калорії: {bb_calories2}, Вартість: {bb_cost2}, Розрив: {bb_gap2:.2%}")
+    
+    # Кілька бюджетів одним проходом DP
+    print("\n\nКілька бюджетів одним проходом DP:")
+    print("=" * 70)
+    for budget_i, (sel, sel_cost, sel_calories) in solve_many(
+            items, [25, 50, 75, 100], reconstruct=True).items():
+        print(f"  Бюджет {budget_i:>3}: {sel_calories} калорій, вартість {sel_cost} "
+              f"({', '.join(sel)})")
+    
+    # Кілька обмежень та обмежені кількості
+    print("\n\nМеню з кількома обмеженнями (вартість, вага, напої):")
+    print("=" * 70)
+    menu = {
+        "pizza": {"cost": 50, "calories": 300, "weight": 400, "category": "food"},
+        "hamburger": {"cost": 40, "calories": 250, "weight": 250, "category": "food"},
+        "hot-dog": {"cost": 30, "calories": 200, "weight": 150, "category": "food",
+                    "quantity": 2},
+        "pepsi": {"cost": 10, "calories": 100, "weight": 330, "category": "drink",
+                  "quantity": 3},
+        "cola": {"cost": 15, "calories": 220, "weight": 330, "category": "drink",
+                 "quantity": 3},
+        "potato": {"cost": 25, "calories": 350, "weight": 200, "category": "food",
+                   "quantity": 2}
+    }
+    limits = {"cost": 120, "weight": 1200, "categories": {"drink": 2}}
+    menu_items, menu_usage, menu_calories, _ = optimize_menu(menu, limits)
+    print(f"  Страви: {menu_items}")
+    print(f"  Ресурси: {menu_usage}")
+    print(f"  Калорії: {menu_calories}")
+    
+    # Порівняння пам'яті способів відновлення
+    print("\n\nПам'ять відновлення набору (2000 страв):")
+    print("=" * 70)
+    benchmark_reconstruction_memory()
 
 
 if __name__ == "__main__":
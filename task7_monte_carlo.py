@@ -1,62 +1,396 @@
 """
 Завдання 7. Використання методу Монте-Карло
-Симуляція кидання двох кубиків та обчислення ймовірностей сум
+Симуляція кидання кубиків (за замовчуванням - двох шестигранних)
+та обчислення ймовірностей сум
 """
 
-import random
+import json
+import math
+import os
+import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
 
+import numpy as np
 
-def analytical_probabilities():
+# Кількість кидків в одному блоці векторизованої симуляції
+CHUNK_SIZE = 1 << 20
+
+# Журнал контрольних точок симуляції (JSON lines)
+RESULTS_LOG = 'task7_results.jsonl'
+
+# Якщо комбінацій кубиків не більше, кидок кодується одним випадковим числом
+OUTCOME_ENCODING_LIMIT = 4096
+
+# Поки кількість комбінацій менша, аналітичний розподіл рахується точно в цілих
+EXACT_OUTCOME_LIMIT = 2 ** 53
+
+
+def _dice_faces(num_dice, faces):
     """
-    Повертає аналітичні ймовірності для сум двох кубиків.
-    Всього можливих комбінацій: 6 * 6 = 36
+    Повертає кортеж кількості граней кожного кубика.
+
+    faces - кількість граней (однакова для всіх num_dice кубиків) або
+    послідовність граней кожного кубика (тоді num_dice не використовується).
     """
-    probabilities = {
-        2: 1/36,   # (1,1)
-        3: 2/36,   # (1,2), (2,1)
-        4: 3/36,   # (1,3), (2,2), (3,1)
-        5: 4/36,   # (1,4), (2,3), (3,2), (4,1)
-        6: 5/36,   # (1,5), (2,4), (3,3), (4,2), (5,1)
-        7: 6/36,   # (1,6), (2,5), (3,4), (4,3), (5,2), (6,1)
-        8: 5/36,   # (2,6), (3,5), (4,4), (5,3), (6,2)
-        9: 4/36,   # (3,6), (4,5), (5,4), (6,3)
-        10: 3/36,  # (4,6), (5,5), (6,4)
-        11: 2/36,  # (5,6), (6,5)
-        12: 1/36   # (6,6)
-    }
-    return probabilities
+    if isinstance(faces, int):
+        return (faces,) * num_dice
+    return tuple(faces)
 
 
-def simulate_dice_rolls(num_simulations):
+def analytical_probabilities(num_dice=2, faces=6):
     """
-    Симулює кидання двох кубиків num_simulations разів.
-    
+    Повертає аналітичні ймовірності для сум кубиків.
+
+    Розподіл суми - згортка розподілів окремих кубиків. Поки кількість
+    комбінацій менша за 2^53, згортка виконується над цілими кількостями
+    комбінацій (точно). Для великих наборів кубики групуються за кількістю
+    граней, і розподіл обчислюється через FFT: спектр одного кубика
+    підноситься до степеня кількості таких кубиків.
+
+    Для двох шестигранних кубиків: всього можливих комбінацій 6 * 6 = 36,
+    ймовірності 1/36, 2/36, ..., 6/36 (сума 7), ..., 1/36.
+
     Args:
-        num_simulations: кількість кидків
-        
+        num_dice: кількість кубиків
+        faces: кількість граней або послідовність граней кожного кубика
+
     Returns:
-        dict: словник з ймовірностями для кожної суми
+        dict: {сума: ймовірність}
     """
-    sums = []
-    
-    # Виконуємо симуляцію
-    for _ in range(num_simulations):
-        dice1 = random.randint(1, 6)
-        dice2 = random.randint(1, 6)
-        sums.append(dice1 + dice2)
+    faces = _dice_faces(num_dice, faces)
+    min_sum = len(faces)
+    outcomes = math.prod(faces)
+
+    if outcomes < EXACT_OUTCOME_LIMIT:
+        # Точна згортка кількостей комбінацій
+        distribution = np.ones(1, dtype=np.int64)
+        for face_count in faces:
+            distribution = np.convolve(distribution, np.ones(face_count, dtype=np.int64))
+        distribution = distribution / outcomes
+    else:
+        # Згортка через FFT: добуток спектрів розподілів окремих кубиків
+        length = sum(faces) - min_sum + 1
+        fft_size = 1 << (length - 1).bit_length()
+        spectrum = np.ones(fft_size // 2 + 1, dtype=np.complex128)
+        for face_count, count in Counter(faces).items():
+            single = np.full(face_count, 1 / face_count)
+            spectrum *= np.fft.rfft(single, fft_size) ** count
+        distribution = np.fft.irfft(spectrum, fft_size)[:length]
+        np.clip(distribution, 0, None, out=distribution)
+        distribution /= distribution.sum()
+
+    return {min_sum + i: float(p) for i, p in enumerate(distribution)}
+
+
+def _outcome_sums(faces):
+    """Сума кубиків для кожного номера комбінації (змішана система числення)"""
+    index = np.arange(math.prod(faces))
+    sums = np.zeros(len(index), dtype=np.intp)
+    for face_count in reversed(faces):
+        sums += index % face_count + 1
+        index //= face_count
+    return sums
+
+
+def _count_sums(rng, num_rolls, faces, chunk_size):
+    """
+    Підраховує частоти сум кубиків для num_rolls кидків генератором rng.
+
+    Якщо комбінацій небагато (для двох шестигранних - 36), кидок усіх
+    кубиків кодується одним числом з рівноймовірних комбінацій - один виклик
+    генератора на кидок. Інакше всі кубики блоку генеруються одним
+    векторизованим викликом у матрицю (кидки × кубики).
+
+    Returns:
+        numpy.ndarray: масив частот, індекс - сума
+    """
+    max_sum = sum(faces)
+    outcomes = math.prod(faces)
+    counts = np.zeros(max_sum + 1, dtype=np.int64)
+    remaining = num_rolls
+
+    if outcomes <= OUTCOME_ENCODING_LIMIT:
+        outcome_counts = np.zeros(outcomes, dtype=np.int64)
+        
+        # Виконуємо симуляцію блоками
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            rolls = rng.integers(0, outcomes, size=size, dtype=np.intp)
+            outcome_counts += np.bincount(rolls, minlength=outcomes)
+            remaining -= size
+        
+        np.add.at(counts, _outcome_sums(faces), outcome_counts)
+        return counts
+
+    high = np.array(faces) + 1
+    rows = max(1, chunk_size // len(faces))
+    while remaining > 0:
+        size = min(rows, remaining)
+        rolls = rng.integers(1, high, size=(size, len(faces)), dtype=np.intp)
+        counts += np.bincount(rolls.sum(axis=1), minlength=max_sum + 1)
+        remaining -= size
+
+    return counts
+
+
+def _counts_to_result(counts, num_simulations, faces):
+    """Перетворює масив частот на (ймовірності сум, Counter з частотами сум)"""
+    sum_range = range(len(faces), sum(faces) + 1)
     
-    # Підраховуємо частоту кожної суми
-    sum_counts = Counter(sums)
+    # Частота кожної суми
+    sum_counts = Counter({sum_value: int(counts[sum_value]) for sum_value in sum_range})
     
     # Обчислюємо ймовірності
     probabilities = {}
-    for sum_value in range(2, 13):
+    for sum_value in sum_range:
         probabilities[sum_value] = sum_counts.get(sum_value, 0) / num_simulations
     
     return probabilities, sum_counts
 
 
+def simulate_dice_rolls(num_simulations, seed=None, chunk_size=CHUNK_SIZE,
+                        num_dice=2, faces=6):
+    """
+    Симулює кидання кубиків (за замовчуванням двох шестигранних) num_simulations разів.
+
+    Кидки генеруються векторизовано через numpy.random.Generator.integers
+    блоками по chunk_size, а частоти підраховуються через np.bincount.
+    Суми окремих кидків не зберігаються, тому пам'ять обмежена розміром
+    блоку незалежно від кількості кидків.
+    
+    Args:
+        num_simulations: кількість кидків
+        seed: зерно генератора (None - випадкове)
+        chunk_size: кількість кидків в одному блоці
+        num_dice: кількість кубиків
+        faces: кількість граней або послідовність граней кожного кубика
+        
+    Returns:
+        tuple: (словник з ймовірностями для кожної суми, Counter з частотами сум)
+    """
+    faces = _dice_faces(num_dice, faces)
+    rng = np.random.default_rng(seed)
+    counts = _count_sums(rng, num_simulations, faces, chunk_size)
+    return _counts_to_result(counts, num_simulations, faces)
+
+
+def _simulate_worker(seed_sequence, num_rolls, faces, chunk_size):
+    """Симуляція в окремому процесі з власним незалежним потоком випадкових чисел"""
+    return _count_sums(np.random.default_rng(seed_sequence), num_rolls, faces, chunk_size)
+
+
+def simulate_dice_rolls_parallel(num_simulations, seed=None, workers=None,
+                                 chunk_size=CHUNK_SIZE, num_dice=2, faces=6):
+    """
+    Паралельна відтворювана симуляція кидання кубиків у пулі процесів.
+
+    Кидки діляться між workers процесами. Кожен процес отримує власний
+    статистично незалежний потік з SeedSequence(seed).spawn(workers), а
+    частоти сум з усіх процесів сумуються. Для однакових seed і workers
+    результат побітово однаковий.
+
+    Args:
+        num_simulations: кількість кидків
+        seed: зерно генератора (None - випадкове, результат не відтворюваний)
+        workers: кількість процесів (None - кількість ядер)
+        chunk_size: кількість кидків в одному блоці
+        num_dice: кількість кубиків
+        faces: кількість граней або послідовність граней кожного кубика
+
+    Returns:
+        tuple: (словник з ймовірностями для кожної суми, Counter з частотами сум)
+    """
+    faces = _dice_faces(num_dice, faces)
+    workers = workers or os.cpu_count() or 1
+    seed_sequences = np.random.SeedSequence(seed).spawn(workers)
+
+    # Перші num_simulations % workers процесів отримують на один кидок більше
+    base, extra = divmod(num_simulations, workers)
+    shares = [base + (1 if i < extra else 0) for i in range(workers)]
+
+    if workers == 1:
+        counts = _simulate_worker(seed_sequences[0], shares[0], faces, chunk_size)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_simulate_worker, seed_sequences, shares,
+                                   [faces] * workers, [chunk_size] * workers)
+            counts = sum(results, np.zeros(sum(faces) + 1, dtype=np.int64))
+
+    return _counts_to_result(counts, num_simulations, faces)
+
+
+def _convergence_point(counts, num_simulations, faces, analytical, z):
+    """
+    Точка кривої збіжності: (кидки, макс. абсолютна похибка відносно
+    аналітичних ймовірностей, макс. напівширина довірчого інтервалу)
+    """
+    estimate = counts[len(faces):] / num_simulations
+    max_error = float(np.max(np.abs(estimate - analytical)))
+    half_width = float(np.max(z * np.sqrt(estimate * (1 - estimate) / num_simulations)))
+    return num_simulations, max_error, half_width
+
+
+def simulate_until_converged(target_precision=0.001, confidence=0.95,
+                             batch_size=100_000, max_simulations=10**9, seed=None,
+                             num_dice=2, faces=6):
+    """
+    Потокова симуляція з відстеженням збіжності та ранньою зупинкою.
+
+    Частоти оновлюються блоками по batch_size кидків. Після кожного блоку
+    обчислюються максимальна абсолютна похибка відносно аналітичних
+    ймовірностей та напівширина довірчого інтервалу для кожної суми
+    (нормальне наближення: z * sqrt(p * (1 - p) / n)). Симуляція
+    зупиняється, щойно найбільша напівширина не перевищує target_precision.
+
+    Args:
+        target_precision: бажана напівширина довірчого інтервалу (частка, 0.001 = 0.1%)
+        confidence: рівень довіри інтервалу
+        batch_size: кількість кидків в одному блоці
+        max_simulations: максимальна кількість кидків
+        seed: зерно генератора (None - випадкове)
+        num_dice: кількість кубиків
+        faces: кількість граней або послідовність граней кожного кубика
+
+    Returns:
+        tuple: (ймовірності, Counter з частотами сум,
+                крива збіжності [(кидки, макс. похибка, макс. напівширина)])
+    """
+    faces = _dice_faces(num_dice, faces)
+    rng = np.random.default_rng(seed)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    analytical = np.array(list(analytical_probabilities(faces=faces).values()))
+
+    counts = np.zeros(sum(faces) + 1, dtype=np.int64)
+    num_simulations = 0
+    convergence = []
+
+    while num_simulations < max_simulations:
+        size = min(batch_size, max_simulations - num_simulations)
+        counts += _count_sums(rng, size, faces, batch_size)
+        num_simulations += size
+
+        point = _convergence_point(counts, num_simulations, faces, analytical, z)
+        convergence.append(point)
+        half_width = point[2]
+
+        if half_width <= target_precision:
+            break
+
+    probabilities, sum_counts = _counts_to_result(counts, num_simulations, faces)
+    return probabilities, sum_counts, convergence
+
+
+def simulate_with_variance_reduction(num_simulations, method="stratified", seed=None,
+                                     chunk_size=CHUNK_SIZE, num_dice=2, faces=6):
+    """
+    Оцінка ймовірностей сум з методами зменшення дисперсії.
+
+    Методи:
+        "plain" - звичайна симуляція (база для порівняння);
+        "antithetic" - антитетичні змінні: кожному кидку (d1, d2, ...) відповідає
+            дзеркальний (f1 + 1 - d1, f2 + 1 - d2, ...) з сумою max_sum + min_sum - S;
+        "stratified" - стратифікація за першим кубиком: для кожного його
+            значення виконується рівна частка кидків решти кубиків
+            (потрібно щонайменше стільки кидків, скільки граней у першого кубика);
+        "control" - контрольна змінна S з відомим середнім
+            (для двох шестигранних кубиків - 7).
+
+    Усі оцінки та їхні дисперсії обчислюються з гістограм сум, тому окремі
+    кидки не зберігаються.
+
+    Args:
+        num_simulations: кількість кидків (щонайменше 1, для "antithetic" - 2)
+        method: "plain", "antithetic", "stratified" або "control"
+        seed: зерно генератора (None - випадкове)
+        chunk_size: кількість кидків в одному блоці
+        num_dice: кількість кубиків
+        faces: кількість граней або послідовність граней кожного кубика
+
+    Returns:
+        tuple: (ймовірності, звіт {"variance_reduction": коефіцієнт зменшення
+                сумарної дисперсії, "effective_sample_size": ефективний розмір
+                вибірки, "variance": {сума: дисперсія оцінки}})
+    """
+    faces = _dice_faces(num_dice, faces)
+    # Мінімальна кількість кидків: хоча б одна пара для антитетичних змінних
+    # і хоча б один кидок на страту (інакше її вага 1 / faces[0] втрачається)
+    min_simulations = {"plain": 1, "control": 1, "antithetic": 2, "stratified": faces[0]}
+    if method not in min_simulations:
+        raise ValueError(f"Невідомий метод зменшення дисперсії: {method}")
+    if num_simulations < min_simulations[method]:
+        raise ValueError(f"Метод {method} потребує щонайменше "
+                         f"{min_simulations[method]} кидків")
+
+    rng = np.random.default_rng(seed)
+    min_sum, max_sum = len(faces), sum(faces)
+    sums = np.arange(max_sum + 1)
+
+    if method == "plain" or method == "control":
+        counts = _count_sums(rng, num_simulations, faces, chunk_size)
+        indicator_mean = counts / num_simulations
+        estimate = indicator_mean.copy()
+        variance = indicator_mean * (1 - indicator_mean) / num_simulations
+
+        if method == "control":
+            # Контрольна змінна S: коваріація індикатора 1{S=s} з S дорівнює
+            # p_s * (s - E[S]) і так само обчислюється з гістограми
+            known_mean = sum((f + 1) / 2 for f in faces)
+            sample_mean = float(np.dot(sums, indicator_mean))
+            sample_var = float(np.dot((sums - sample_mean) ** 2, indicator_mean))
+            if sample_var > 0:
+                covariance = indicator_mean * (sums - sample_mean)
+                beta = covariance / sample_var
+                estimate = indicator_mean - beta * (sample_mean - known_mean)
+                indicator_var = indicator_mean * (1 - indicator_mean)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    rho2 = np.where(indicator_var > 0,
+                                    covariance ** 2 / (indicator_var * sample_var), 0.0)
+                variance = indicator_var * (1 - rho2) / num_simulations
+
+    elif method == "antithetic":
+        pairs = num_simulations // 2
+        counts = _count_sums(rng, pairs, faces, chunk_size)
+        mirrored = counts[::-1][:max_sum + 1 - min_sum]
+        mirrored = np.concatenate((np.zeros(min_sum, dtype=np.int64), mirrored))
+        # Y_s = (1{S=s} + 1{S'=s}) / 2 для пари; E[Y_s^2] теж з гістограми
+        estimate = (counts + mirrored) / (2 * pairs)
+        second_moment = (counts + mirrored) / (4 * pairs)
+        middle = min_sum + max_sum
+        if middle % 2 == 0:
+            second_moment[middle // 2] = counts[middle // 2] / pairs
+        variance = (second_moment - estimate ** 2) / pairs
+
+    else:
+        first, rest = faces[0], faces[1:]
+        base, extra = divmod(num_simulations, first)
+        estimate = np.zeros(max_sum + 1)
+        variance = np.zeros(max_sum + 1)
+        for value in range(1, first + 1):
+            size = base + (1 if value <= extra else 0)
+            rest_counts = _count_sums(rng, size, rest, chunk_size)
+            conditional = np.zeros(max_sum + 1)
+            conditional[value:value + len(rest_counts)] = rest_counts / size
+            # Страти рівноймовірні, вага кожної - 1 / first
+            estimate += conditional / first
+            variance += conditional * (1 - conditional) / size / first ** 2
+
+    estimate = estimate[min_sum:]
+    variance = np.maximum(variance[min_sum:], 0.0)
+    plain_variance = estimate * (1 - estimate) / num_simulations
+    total_variance = float(variance.sum())
+    reduction = float(plain_variance.sum()) / total_variance if total_variance > 0 else math.inf
+
+    probabilities = {min_sum + i: float(p) for i, p in enumerate(estimate)}
+    report = {
+        "variance_reduction": reduction,
+        "effective_sample_size": num_simulations * reduction,
+        "variance": {min_sum + i: float(v) for i, v in enumerate(variance)},
+    }
+    return probabilities, report
+
+
 def print_comparison_table(monte_carlo_prob, analytical_prob, num_simulations):
     """
     Виводить таблицю порівняння результатів Монте-Карло та аналітичних розрахунків.
@@ -67,7 +401,7 @@ def print_comparison_table(monte_carlo_prob, analytical_prob, num_simulations):
     print(f"{'Сума':<6} {'Монте-Карло':<15} {'Аналітична':<15} {'Різниця':<15}")
     print(f"{'-'*80}")
     
-    for sum_value in range(2, 13):
+    for sum_value in analytical_prob:
         mc_prob = monte_carlo_prob[sum_value]
         an_prob = analytical_prob[sum_value]
         difference = abs(mc_prob - an_prob)
@@ -79,19 +413,43 @@ def print_comparison_table(monte_carlo_prob, analytical_prob, num_simulations):
     print(f"{'='*80}\n")
 
 
-def save_results_to_markdown(monte_carlo_prob, analytical_prob, num_simulations, filename='task7_results.md'):
+def _describe_sums(sums):
+    """Форматує перелік сум для висновків: «Сума 7 має» або «Суми 2 та 12 мають»"""
+    if len(sums) == 1:
+        return f"Сума {sums[0]} має"
+    return f"Суми {', '.join(map(str, sums[:-1]))} та {sums[-1]} мають"
+
+
+def _describe_dice(faces):
+    """Опис набору кубиків для заголовка звіту: «двох кубиків» або «кубиків 3d20 + 1d6»"""
+    if tuple(faces) == (6, 6):
+        return "двох кубиків"
+    groups = Counter(faces)
+    return "кубиків " + " + ".join(f"{count}d{sides}" for sides, count in groups.items())
+
+
+def save_results_to_markdown(monte_carlo_prob, analytical_prob, num_simulations, filename='task7_results.md',
+                             convergence=None, dice_description="двох кубиків"):
     """
     Зберігає результати у markdown файл.
+
+    Якщо передано convergence (крива з simulate_until_converged),
+    до звіту додається таблиця збіжності.
     """
+    highest = max(analytical_prob.values())
+    lowest = min(analytical_prob.values())
+    most_likely = [s for s, p in analytical_prob.items() if math.isclose(p, highest)]
+    least_likely = [s for s, p in analytical_prob.items() if math.isclose(p, lowest)]
+
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write("# Симуляція кидання двох кубиків методом Монте-Карло\n\n")
+        f.write(f"# Симуляція кидання {dice_description} методом Монте-Карло\n\n")
         f.write(f"Кількість симуляцій: **{num_simulations:,}**\n\n")
         
         f.write("## Таблиця порівняння ймовірностей\n\n")
         f.write("| Сума | Монте-Карло | Аналітична | Різниця |\n")
         f.write("|------|-------------|------------|----------|\n")
         
-        for sum_value in range(2, 13):
+        for sum_value in analytical_prob:
             mc_prob = monte_carlo_prob[sum_value]
             an_prob = analytical_prob[sum_value]
             difference = abs(mc_prob - an_prob)
@@ -101,21 +459,199 @@ def save_results_to_markdown(monte_carlo_prob, analytical_prob, num_simulations,
                    f"{difference:.5f} ({difference*100:.2f}%) |\n")
         
         f.write("\n## Висновки\n\n")
-        max_diff = max(abs(monte_carlo_prob[s] - analytical_prob[s]) for s in range(2, 13))
+        max_diff = max(abs(monte_carlo_prob[s] - analytical_prob[s]) for s in analytical_prob)
         f.write(f"- Максимальна різниця: **{max_diff*100:.4f}%**\n")
-        f.write(f"- Сума 7 має найвищу ймовірність (~16.67%)\n")
-        f.write(f"- Суми 2 та 12 мають найнижчу ймовірність (~2.78%)\n")
+        f.write(f"- {_describe_sums(most_likely)} найвищу ймовірність (~{highest*100:.2f}%)\n")
+        f.write(f"- {_describe_sums(least_likely)} найнижчу ймовірність (~{lowest*100:.2f}%)\n")
         f.write(f"- Результати Монте-Карло дуже близькі до аналітичних розрахунків\n")
+        
+        if convergence:
+            f.write("\n## Збіжність симуляції\n\n")
+            f.write(f"Остання точка кривої: **{convergence[-1][0]:,}** кидків.\n\n")
+            f.write("| Кидки | Макс. похибка | Макс. напівширина інтервалу |\n")
+            f.write("|-------|---------------|-----------------------------|\n")
+            for rolls, max_error, half_width in convergence:
+                f.write(f"| {rolls:,} | {max_error*100:.4f}% | {half_width*100:.4f}% |\n")
     
     print(f"Результати збережено у файл: {filename}")
 
 
+def _read_results_log(log_path):
+    """
+    Читає журнал контрольних точок (JSON lines).
+
+    Недописані рядки (перервані запуски) ігноруються.
+
+    Returns:
+        tuple: (конфігурація запуску або None, список контрольних точок)
+    """
+    config, checkpoints = None, []
+    if not os.path.exists(log_path):
+        return config, checkpoints
+
+    with open(log_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record["type"] == "config":
+                config = record
+            elif record["type"] == "checkpoint":
+                checkpoints.append(record)
+    return config, checkpoints
+
+
+def run_with_checkpoints(num_simulations, log_path=RESULTS_LOG, batch_size=CHUNK_SIZE,
+                         seed=None, num_dice=2, faces=6):
+    """
+    Симуляція з дозаписом контрольних точок у журнал JSON lines.
+
+    Після кожного блоку кидків до журналу дописується рядок з кількістю
+    кидків, частотами сум і станом генератора. Якщо журнал для тієї ж
+    конфігурації (грані, кількість кидків і зерно) вже існує, симуляція
+    продовжується з останньої контрольної точки (той самий потік випадкових
+    чисел, що й без переривання). З seed=None зерно береться з журналу,
+    тому перерваний запуск продовжується так само.
+
+    Журнал іншої конфігурації не перезаписується: його перейменовано
+    на <log_path>.1 (.2, ...), і симуляція починається з нового журналу.
+
+    Args:
+        num_simulations: загальна кількість кидків
+        log_path: шлях до журналу
+        batch_size: кількість кидків між контрольними точками
+        seed: зерно генератора (None - випадкове)
+        num_dice: кількість кубиків
+        faces: кількість граней або послідовність граней кожного кубика
+
+    Returns:
+        tuple: (словник з ймовірностями для кожної суми, Counter з частотами сум)
+    """
+    faces = _dice_faces(num_dice, faces)
+    stored_config, checkpoints = _read_results_log(log_path)
+    resume = (stored_config is not None
+              and stored_config.get("faces") == list(faces)
+              and stored_config.get("num_simulations") == num_simulations
+              and stored_config.get("entropy") is not None)
+
+    # Ентропія SeedSequence ідентифікує потік випадкових чисел запуску;
+    # без явного зерна продовжується потік із журналу
+    if resume and seed is None:
+        seed_sequence = np.random.SeedSequence(stored_config["entropy"])
+    else:
+        seed_sequence = np.random.SeedSequence(seed)
+        resume = resume and stored_config["entropy"] == seed_sequence.entropy
+    config = {"type": "config", "faces": list(faces), "num_simulations": num_simulations,
+              "entropy": seed_sequence.entropy}
+    rng = np.random.default_rng(seed_sequence)
+
+    if resume:
+        mode = 'a'
+        if checkpoints:
+            counts = np.array(checkpoints[-1]["counts"], dtype=np.int64)
+            done = checkpoints[-1]["rolls"]
+            rng.bit_generator.state = checkpoints[-1]["rng_state"]
+        else:
+            counts = np.zeros(sum(faces) + 1, dtype=np.int64)
+            done = 0
+    else:
+        mode = 'w'
+        counts = np.zeros(sum(faces) + 1, dtype=np.int64)
+        done = 0
+        if os.path.exists(log_path) and os.path.getsize(log_path) > 0:
+            backup = _rotate_log(log_path)
+            print(f"Журнал {log_path} належить іншому запуску, збережено як {backup}")
+
+    with open(log_path, mode, encoding='utf-8') as log:
+        if mode == 'w':
+            log.write(json.dumps(config) + "\n")
+        elif done and not _log_ends_with_newline(log_path):
+            # Відокремлюємо недописаний рядок перерваного запуску
+            log.write("\n")
+
+        while done < num_simulations:
+            size = min(batch_size, num_simulations - done)
+            counts += _count_sums(rng, size, faces, batch_size)
+            done += size
+            log.write(json.dumps({"type": "checkpoint", "rolls": done,
+                                  "counts": counts.tolist(),
+                                  "rng_state": rng.bit_generator.state}) + "\n")
+            log.flush()
+
+    return _counts_to_result(counts, num_simulations, faces)
+
+
+def _rotate_log(log_path):
+    """Перейменовує журнал на перше вільне ім'я <log_path>.N і повертає його"""
+    number = 1
+    while os.path.exists(f"{log_path}.{number}"):
+        number += 1
+    backup = f"{log_path}.{number}"
+    os.replace(log_path, backup)
+    return backup
+
+
+def _log_ends_with_newline(log_path):
+    """Чи закінчується файл журналу символом нового рядка"""
+    with open(log_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def render_report_from_log(log_path=RESULTS_LOG, markdown_filename='task7_results.md',
+                           console=True, confidence=0.95):
+    """
+    Формує звіти з журналу контрольних точок без повторної симуляції.
+
+    Таблиця порівняння будується з останньої контрольної точки, а крива
+    збіжності - з усіх точок журналу.
+
+    Args:
+        log_path: шлях до журналу
+        markdown_filename: файл markdown-звіту (None - не зберігати)
+        console: чи виводити таблицю порівняння в консоль
+        confidence: рівень довіри для кривої збіжності
+
+    Returns:
+        tuple: (ймовірності Монте-Карло, аналітичні ймовірності, кількість кидків)
+    """
+    config, checkpoints = _read_results_log(log_path)
+    if config is None or not checkpoints:
+        raise ValueError(f"Журнал {log_path} не містить контрольних точок")
+
+    faces = tuple(config["faces"])
+    analytical_prob = analytical_probabilities(faces=faces)
+    analytical = np.array(list(analytical_prob.values()))
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    convergence = [
+        _convergence_point(np.array(point["counts"]), point["rolls"], faces, analytical, z)
+        for point in checkpoints
+    ]
+    num_simulations = checkpoints[-1]["rolls"]
+    monte_carlo_prob, _ = _counts_to_result(np.array(checkpoints[-1]["counts"]),
+                                            num_simulations, faces)
+
+    if console:
+        print_comparison_table(monte_carlo_prob, analytical_prob, num_simulations)
+    if markdown_filename:
+        save_results_to_markdown(monte_carlo_prob, analytical_prob, num_simulations,
+                                 markdown_filename, convergence=convergence,
+                                 dice_description=_describe_dice(faces))
+
+    return monte_carlo_prob, analytical_prob, num_simulations
+
+
 def main():
     """
     Головна функція програми.
     """
-    # Кількість симуляцій
-    num_simulations = 1_000_000
+    # Бажана точність: напівширина 95% довірчого інтервалу для кожної суми
+    target_precision = 0.001
     
     print("\n" + "="*80)
     print("Симуляція кидання двох кубиків методом Монте-Карло")
@@ -124,22 +660,50 @@ def main():
     # Отримуємо аналітичні ймовірності
     analytical_prob = analytical_probabilities()
     
-    # Виконуємо симуляцію
-    print(f"\nВиконується симуляція {num_simulations:,} кидків кубиків...")
-    monte_carlo_prob, sum_counts = simulate_dice_rolls(num_simulations)
+    # Потокова симуляція з ранньою зупинкою: кидків рівно стільки, скільки потрібно для точності
+    print(f"\nПотокова симуляція до точності ±{target_precision*100:.2f}% (довіра 95%)...")
+    monte_carlo_prob, sum_counts, convergence = simulate_until_converged(target_precision)
+    for rolls, max_error, half_width in convergence:
+        print(f"  {rolls:>9,} кидків: макс. похибка {max_error*100:.4f}%, "
+              f"напівширина {half_width*100:.4f}%")
+    num_simulations = convergence[-1][0]
     
     # Виводимо частоту появи кожної суми
-    print(f"\nЧастота появи кожної суми:")
+    print(f"\nЧастота появи кожної суми ({num_simulations:,} кидків):")
     print(f"{'-'*40}")
-    for sum_value in range(2, 13):
+    for sum_value in analytical_prob:
         count = sum_counts.get(sum_value, 0)
         print(f"Сума {sum_value:2d}: {count:7,} разів")
     
     # Виводимо таблицю порівняння
     print_comparison_table(monte_carlo_prob, analytical_prob, num_simulations)
 
-    # Зберігаємо результати у markdown файл
-    save_results_to_markdown(monte_carlo_prob, analytical_prob, num_simulations)
+    # Зменшення дисперсії
+    print("\nМетоди зменшення дисперсії (100,000 кидків):")
+    for method in ("plain", "antithetic", "stratified", "control"):
+        vr_prob, report = simulate_with_variance_reduction(100_000, method=method)
+        max_error = max(abs(vr_prob[s] - p) for s, p in analytical_prob.items())
+        print(f"  {method:<11} макс. похибка {max_error*100:.4f}%, "
+              f"зменшення дисперсії ×{report['variance_reduction']:.2f}, "
+              f"ефективна вибірка {report['effective_sample_size']:,.0f}")
+    
+    # Довільні набори кубиків
+    print("\nДовільні набори кубиків:")
+    for description, faces in (("10d20", (20,) * 10), ("3d6 + 2d8 + d12", (6, 6, 6, 8, 8, 12))):
+        pool_analytical = analytical_probabilities(faces=faces)
+        pool_prob, _ = simulate_dice_rolls(1_000_000, faces=faces)
+        max_error = max(abs(pool_prob[s] - p) for s, p in pool_analytical.items())
+        print(f"  {description}: {len(pool_analytical)} сум, макс. похибка {max_error*100:.4f}%")
+    
+    start = time.perf_counter()
+    large_pool = analytical_probabilities(num_dice=500, faces=20)
+    elapsed = time.perf_counter() - start
+    print(f"  500d20 (FFT): {len(large_pool)} сум за {elapsed*1000:.1f} мс, "
+          f"найімовірніша сума {max(large_pool, key=large_pool.get)}\n")
+
+    # Зберігаємо у markdown результати потокової симуляції разом з її кривою збіжності
+    save_results_to_markdown(monte_carlo_prob, analytical_prob, num_simulations,
+                             convergence=convergence)
 
 
 if __name__ == "__main__":
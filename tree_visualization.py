@@ -0,0 +1,211 @@
+"""
+Спільна візуалізація бінарних дерев для завдань 4 та 5.
+
+networkx і matplotlib імпортуються лише під час першого малювання,
+тому модулі з алгоритмами (купи, обходи) імпортуються швидко.
+Позиції вузлів кешуються за формою дерева.
+"""
+
+import gc
+from collections import OrderedDict
+
+
+# Кеш позицій вузлів: форма дерева -> список позицій у прямому порядку обходу
+_LAYOUT_CACHE = OrderedDict()
+_LAYOUT_CACHE_SIZE = 16
+
+
+class Node:
+    # __slots__ прибирає словник атрибутів у кожного вузла
+    __slots__ = ("left", "right", "val", "color", "id")
+
+    def __init__(self, key, color="skyblue", node_id=None):
+        self.left = None
+        self.right = None
+        self.val = key
+        self.color = color  # Додатковий аргумент для зберігання кольору вузла
+        # Унікальний ідентифікатор для кожного вузла: індекс у масиві купи
+        # (див. heap_to_tree) або, якщо його не задано, id об'єкта
+        self.id = id(self) if node_id is None else node_id
+
+
+def _preorder(root):
+    """Вузли дерева у прямому порядку обходу (зі стеком, без рекурсії)"""
+    nodes = []
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+    return nodes
+
+
+def tree_layout(root):
+    """
+    Обчислює позиції вузлів для малювання: корінь у (0, 0), нащадки вузла
+    рівня layer - на рівень нижче і на 1 / 2^layer лівіше або правіше.
+
+    Позиції залежать лише від форми дерева, тому кешуються за нею:
+    повторне малювання дерева тієї ж форми не перераховує розташування.
+    У кеші зберігаються лише _LAYOUT_CACHE_SIZE останніх форм.
+
+    Args:
+        root: Корінь дерева
+
+    Returns:
+        tuple: (вузли у прямому порядку обходу, {id вузла: (x, y)})
+    """
+    nodes = _preorder(root)
+    shape = tuple((node.left is not None, node.right is not None) for node in nodes)
+
+    positions = _LAYOUT_CACHE.get(shape)
+    if positions is None:
+        coordinates = {}
+        if root is not None:
+            coordinates[id(root)] = (0, 0, 1)
+        for node in nodes:
+            x, y, layer = coordinates[id(node)]
+            if node.left:
+                coordinates[id(node.left)] = (x - 1 / 2 ** layer, y - 1, layer + 1)
+            if node.right:
+                coordinates[id(node.right)] = (x + 1 / 2 ** layer, y - 1, layer + 1)
+        positions = [coordinates[id(node)][:2] for node in nodes]
+        _LAYOUT_CACHE[shape] = positions
+        while len(_LAYOUT_CACHE) > _LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.popitem(last=False)
+    else:
+        _LAYOUT_CACHE.move_to_end(shape)
+
+    return nodes, {node.id: position for node, position in zip(nodes, positions)}
+
+
+def draw_tree(tree_root, title="Binary Tree", font_color="black"):
+    """
+    Візуалізує дерево з кольорами
+
+    Args:
+        tree_root: Корінь дерева
+        title: Заголовок візуалізації
+        font_color: Колір підписів вузлів
+    """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    nodes, pos = tree_layout(tree_root)
+
+    tree = nx.DiGraph()
+    for node in nodes:
+        tree.add_node(node.id, color=node.color, label=node.val)
+        if node.left:
+            tree.add_edge(node.id, node.left.id)
+        if node.right:
+            tree.add_edge(node.id, node.right.id)
+
+    colors = [node[1]['color'] for node in tree.nodes(data=True)]
+    labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
+
+    plt.figure(figsize=(12, 8))
+    nx.draw(tree, pos=pos, labels=labels, arrows=False,
+            node_size=2500, node_color=colors, font_size=10,
+            font_weight='bold', font_color=font_color)
+    plt.title(title, fontsize=16, fontweight='bold')
+    plt.show()
+
+
+def heap_to_tree(heap_array, index=0, color="skyblue"):
+    """
+    Конвертує масив купи у бінарне дерево
+
+    Дерево будується ітеративно, рівень за рівнем: нащадки вузлів рівня
+    займають у масиві суцільний відрізок, тому рекурсія не потрібна
+    і глибина дерева не обмежена стеком викликів.
+    Ідентифікатором вузла є його індекс у масиві, тож однакова купа
+    завжди дає однакові id.
+
+    Args:
+        heap_array: Масив, що представляє купу
+        index: Індекс кореня (піддерева) у масиві
+        color: Початковий колір вузлів
+
+    Returns:
+        Node: Корінь дерева
+    """
+    size = len(heap_array)
+    if index >= size:
+        return None
+
+    # Вузли не утворюють циклів, тому збирач циклічного сміття на час побудови
+    # призупиняється: інакше він багаторазово обходить мільйони нових об'єктів
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        root = Node(heap_array[index], color, index)
+        level = [root]
+        first = index
+
+        while True:
+            # Нащадки вузлів рівня, що починається з first, починаються з 2 * first + 1
+            first = 2 * first + 1
+            if first >= size:
+                break
+            last = min(first + 2 * len(level), size)
+            children = [Node(value, color, node_id)
+                        for node_id, value in zip(range(first, last), heap_array[first:last])]
+
+            for parent, child in zip(level, children[0::2]):
+                parent.left = child
+            for parent, child in zip(level, children[1::2]):
+                parent.right = child
+
+            level = children
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return root
+
+
+def benchmark_node_memory(n=20_000):
+    """
+    Порівнює пам'ять (tracemalloc) дерева з n вузлів, побудованого heap_to_tree,
+    з попередньою реалізацією: вузол зі словником атрибутів, id з uuid4
+    і рекурсивна побудова.
+
+    Returns:
+        tuple: (байтів на вузол раніше, байтів на вузол зараз)
+    """
+    import tracemalloc
+    import uuid
+
+    class LegacyNode:
+        def __init__(self, key, color="skyblue"):
+            self.left = None
+            self.right = None
+            self.val = key
+            self.color = color
+            self.id = str(uuid.uuid4())
+
+    def legacy_heap_to_tree(heap_array, index=0):
+        if index >= len(heap_array):
+            return None
+        node = LegacyNode(heap_array[index])
+        node.left = legacy_heap_to_tree(heap_array, 2 * index + 1)
+        node.right = legacy_heap_to_tree(heap_array, 2 * index + 2)
+        return node
+
+    values = list(range(n))
+    per_node = []
+    for build in (legacy_heap_to_tree, heap_to_tree):
+        tracemalloc.start()
+        root = build(values)
+        # Пам'ять, яку утримує готове дерево
+        per_node.append(tracemalloc.get_traced_memory()[0] / n)
+        tracemalloc.stop()
+        del root
+
+    print(f"\nПам'ять дерева з {n:,} вузлів: {per_node[0]:.0f} Б/вузол раніше "
+          f"(словник атрибутів, uuid4), {per_node[1]:.0f} Б/вузол зараз (__slots__, індекс)")
+    return tuple(per_node)